@@ -54,6 +54,12 @@ class IngestionConfig:
     # ── General ─────────────────────────────────────────────────────
     INGESTION_ENABLED: bool = os.getenv("INGESTION_ENABLED", "true").lower() == "true"
     MAX_EVENTS_PER_POLL: int = int(os.getenv("MAX_EVENTS_PER_POLL", "50"))
+    # Floor for every feed interval, and the ceiling idle feeds back off to
+    # (never beyond 4x a feed's own interval, so new alerts are not held back)
+    MIN_POLL_INTERVAL_S: int = int(os.getenv("MIN_POLL_INTERVAL_S", "30"))
+    MAX_POLL_INTERVAL_S: int = int(os.getenv("MAX_POLL_INTERVAL_S", "600"))
+    # Max events from one poll processed (alerts + predictions) concurrently
+    EVENT_CONCURRENCY: int = int(os.getenv("EVENT_CONCURRENCY", "8"))
 
 
 # Singleton
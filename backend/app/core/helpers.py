@@ -1,9 +1,11 @@
 """
-Shared helper utilities for routers.
+Shared helper utilities for routers and services.
 """
 
+import os
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 
 def serialize_datetime_fields(data: dict[str, Any]) -> dict[str, Any]:
@@ -30,3 +32,9 @@ def serialize_disaster(disaster: dict[str, Any]) -> dict[str, Any]:
         disaster["location_country"] = loc.get("country") or ""
 
     return disaster
+
+
+def uuid4_batch(n: int) -> list[str]:
+    """Return *n* random UUID4 strings, drawing all the entropy in one os.urandom call."""
+    raw = os.urandom(16 * n)
+    return [str(UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * n, 16)]
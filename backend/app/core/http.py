@@ -0,0 +1,33 @@
+"""
+Shared outbound HTTP client for the ingestion feeds and the global
+disaster aggregation service.
+
+One pooled ``httpx.AsyncClient`` is reused across polls so keep-alive
+connections (multiplexed over HTTP/2, via the ``httpx[http2]`` extra) survive
+between scheduler cycles. Closed from the application lifespan on shutdown.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
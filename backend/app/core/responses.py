@@ -0,0 +1,18 @@
+"""
+Shared JSON response classes.
+
+Plain orjson output is FastAPI's own ``ORJSONResponse``; anything needing
+extra orjson options is subclassed here so routers don't each carry a copy.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders datetimes as RFC 3339 with a ``Z`` suffix (naive ones as UTC)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
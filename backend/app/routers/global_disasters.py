@@ -5,12 +5,13 @@ Provides aggregated real-time disaster events from USGS, NASA EONET, GDACS, and
 
 from fastapi import APIRouter, Query
 
+from app.core.responses import UTCORJSONResponse
 from app.services.global_disaster_service import get_global_disasters
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_class=UTCORJSONResponse)
 async def list_global_disasters(
     source: str | None = Query(None, description="Filter by source: usgs, eonet, gdacs, reliefweb"),
     type: str | None = Query(None, description="Filter by disaster type: earthquake, flood, cyclone, wildfire, etc."),
@@ -27,11 +28,15 @@ async def list_global_disasters(
 
     Results are cached for 5 minutes to avoid hammering upstream APIs.
     """
-    return await get_global_disasters(
-        source=source,
-        disaster_type=type,
-        severity=severity,
-        limit=limit,
+    # Returned as a Response so FastAPI skips jsonable_encoder and orjson
+    # formats the event datetimes in C
+    return UTCORJSONResponse(
+        await get_global_disasters(
+            source=source,
+            disaster_type=type,
+            severity=severity,
+            limit=limit,
+        )
     )
 
 
@@ -18,6 +18,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from app.services.ingestion import memory_store
 
@@ -155,7 +156,7 @@ async def latest_weather(location_id: str):
 # ── Satellite observations ──────────────────────────────────────────
 
 
-@router.get("/satellites")
+@router.get("/satellites", response_class=ORJSONResponse)
 async def list_satellite_observations(
     disaster_id: str | None = Query(None),
     confidence: str | None = Query(None, description="low, nominal, high"),
@@ -163,7 +164,7 @@ async def list_satellite_observations(
 ):
     """List recent satellite / fire hotspot observations (from memory)."""
     observations = memory_store.query_satellites(disaster_id=disaster_id, confidence=confidence, limit=limit)
-    return {"observations": observations, "count": len(observations)}
+    return ORJSONResponse({"observations": observations, "count": len(observations)})
 
 
 # ── Alert notifications ────────────────────────────────────────────
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import datetime
 
@@ -106,9 +107,12 @@ async def create_batch_predictions(predictions: list[PredictionInput], ml_servic
     try:
         results = []
 
-        for pred_input in predictions:
-            ml_result = await ml_service.predict(pred_input.prediction_type, pred_input.features)
+        # Issued together so MLService can serve them with one model call per type
+        ml_results = await asyncio.gather(
+            *(ml_service.predict(pred_input.prediction_type, pred_input.features) for pred_input in predictions)
+        )
 
+        for pred_input, ml_result in zip(predictions, ml_results):
             prediction_data = {
                 "id": str(uuid.uuid4()),
                 "location_id": pred_input.location_id,
@@ -9,27 +9,69 @@ Fetches REAL live disaster data from multiple free public APIs:
 
 import asyncio
 import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 import httpx
+import numpy as np
+import orjson
+
+from app.core.http import get_client
 
 logger = logging.getLogger(__name__)
 
 # ── Simple in-memory cache ────────────────────────────────────────────────
 
-_cache: dict = {}
+# Entries are (data, monotonic expiry deadline) so a probe is one float compare.
+_cache: dict[str, tuple[dict, float]] = {}
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
 
 def _get_cached(key: str):
     entry = _cache.get(key)
-    if entry and (datetime.now(UTC) - entry["ts"]).total_seconds() < CACHE_TTL_SECONDS:
-        return entry["data"]
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
     return None
 
 
 def _set_cached(key: str, data):
-    _cache[key] = {"data": data, "ts": datetime.now(UTC)}
+    _cache[key] = (data, time.monotonic() + CACHE_TTL_SECONDS)
+
+
+# ── Timestamp parsing ─────────────────────────────────────────────────────
+
+_DATETIME_MIN_UTC = datetime.min.replace(tzinfo=UTC)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(ts: str) -> datetime:
+    """Parse an upstream ISO-8601 timestamp into an aware datetime.
+
+    Cached because the same events come back on every refresh of the feeds.
+    """
+    if not ts:
+        return _DATETIME_MIN_UTC
+    try:
+        # fromisoformat accepts a trailing "Z" natively on Python 3.11+ (our minimum)
+        dt = datetime.fromisoformat(ts)
+    except (TypeError, ValueError):
+        return _DATETIME_MIN_UTC
+    # Ensure timezone-aware
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _event_datetime(value: datetime | str | None) -> datetime:
+    """Sort key for an event timestamp that may already be a datetime."""
+    if isinstance(value, datetime):
+        return value
+    return _parse_timestamp(value or "")
 
 
 # ── Severity Normalisation ────────────────────────────────────────────────
@@ -45,56 +87,265 @@ def _mag_to_severity(mag: float) -> str:
     return "low"
 
 
+_GDACS_ALERT_SEVERITY = MappingProxyType({"Red": "critical", "Orange": "high", "Green": "medium"})
+_RELIEFWEB_CRITICAL_STATUS_RE = re.compile(r"alert|emergency")
+
+
 def _gdacs_severity(alert_level: str) -> str:
-    mapping = {"Red": "critical", "Orange": "high", "Green": "medium"}
-    return mapping.get(alert_level, "low")
+    return _GDACS_ALERT_SEVERITY.get(alert_level, "low")
 
 
 def _reliefweb_severity(status: str) -> str:
     s = (status or "").lower()
-    if "alert" in s or "emergency" in s:
+    if _RELIEFWEB_CRITICAL_STATUS_RE.search(s):
         return "critical"
     if "ongoing" in s:
         return "high"
     return "medium"
 
 
+# ── Source lookup tables ──────────────────────────────────────────────────
+
+_EONET_CATEGORY_MAP = MappingProxyType(
+    {
+        "wildfires": ("wildfire", "high"),
+        "volcanoes": ("volcanic_eruption", "critical"),
+        "severeStorms": ("cyclone", "high"),
+        "floods": ("flood", "high"),
+        "drought": ("drought", "medium"),
+        "dustHaze": ("other", "low"),
+        "earthquakes": ("earthquake", "high"),
+        "landslides": ("landslide", "high"),
+        "snow": ("other", "low"),
+        "tempExtremes": ("other", "medium"),
+        "waterColor": ("other", "low"),
+        "seaLakeIce": ("other", "low"),
+        "manmade": ("other", "medium"),
+    }
+)
+
+_GDACS_TYPE_MAP = MappingProxyType(
+    {
+        "EQ": "earthquake",
+        "TC": "cyclone",
+        "FL": "flood",
+        "VO": "volcanic_eruption",
+        "DR": "drought",
+        "WF": "wildfire",
+    }
+)
+
+_RELIEFWEB_TYPE_MAP = MappingProxyType(
+    {
+        "Earthquake": "earthquake",
+        "Flood": "flood",
+        "Tropical Cyclone": "cyclone",
+        "Volcano": "volcanic_eruption",
+        "Drought": "drought",
+        "Epidemic": "epidemic",
+        "Storm": "cyclone",
+        "Flash Flood": "flood",
+        "Wild Fire": "wildfire",
+        "Cold Wave": "other",
+        "Heat Wave": "other",
+        "Insect Infestation": "other",
+        "Tsunami": "tsunami",
+        "Landslide": "landslide",
+        "Mud Slide": "landslide",
+        "Technological Disaster": "other",
+        "Complex Emergency": "other",
+    }
+)
+
+# Country center coords (rough estimates for mapping)
+_RELIEFWEB_COUNTRY_COORDS = MappingProxyType(
+    {
+        "AFG": (33.9, 67.7),
+        "BGD": (23.7, 90.4),
+        "BRA": (-14.2, -51.9),
+        "CHN": (35.9, 104.2),
+        "COL": (4.6, -74.1),
+        "COD": (-4.0, 21.8),
+        "ETH": (9.1, 40.5),
+        "GTM": (15.8, -90.2),
+        "HTI": (19.0, -72.4),
+        "IND": (20.6, 78.9),
+        "IDN": (-0.8, 113.9),
+        "IRN": (32.4, 53.7),
+        "IRQ": (33.2, 43.7),
+        "JPN": (36.2, 138.3),
+        "KEN": (-0.02, 37.9),
+        "MEX": (23.6, -102.6),
+        "MMR": (21.9, 95.9),
+        "NPL": (28.4, 84.1),
+        "NGA": (9.1, 8.7),
+        "PAK": (30.4, 69.3),
+        "PHL": (12.9, 121.8),
+        "SOM": (5.2, 46.2),
+        "LKA": (7.9, 80.8),
+        "SDN": (12.9, 30.2),
+        "SYR": (34.8, 38.9),
+        "TUR": (38.9, 35.2),
+        "UKR": (48.4, 31.2),
+        "USA": (37.1, -95.7),
+        "VNM": (14.1, 108.3),
+        "YEM": (15.6, 48.5),
+        "AUS": (-25.3, 133.8),
+        "CHL": (-35.7, -71.5),
+        "PER": (-9.2, -75.0),
+        "ECU": (-1.8, -78.2),
+        "NZL": (-40.9, 174.9),
+        "FJI": (-17.7, 178.1),
+        "MOZ": (-18.7, 35.5),
+        "MDG": (-18.8, 46.9),
+        "ZAF": (-30.6, 22.9),
+        "TZA": (-6.4, 34.9),
+        "UGA": (1.4, 32.3),
+        "MWI": (-13.3, 34.3),
+        "ZMB": (-13.1, 27.8),
+        "ZWE": (-19.0, 29.2),
+        "AGO": (-11.2, 17.9),
+        "CMR": (7.4, 12.4),
+        "GHA": (7.9, -1.0),
+        "SEN": (14.5, -14.5),
+        "MLI": (17.6, -4.0),
+        "NER": (17.6, 8.1),
+        "TCD": (15.5, 18.7),
+        "CAF": (6.6, 20.9),
+        "RWA": (-1.9, 29.9),
+        "BDI": (-3.4, 29.9),
+    }
+)
+
+
+# ── Feature converters ────────────────────────────────────────────────────
+# One module-level function per upstream record shape; the fetchers map these
+# over the decoded payload with a single list comprehension.
+
+
+def _usgs_feature_to_event(feat: dict) -> dict:
+    props = feat.get("properties", {})
+    coords = feat.get("geometry", {}).get("coordinates", [0, 0, 0])
+    return {
+        "id": f"usgs_{feat.get('id', '')}",
+        "source": "USGS",
+        "type": "earthquake",
+        "title": props.get("title", "Earthquake"),
+        "description": f"Magnitude {props.get('mag', '?')} earthquake - {props.get('place', 'Unknown')}",
+        "severity": _mag_to_severity(props.get("mag", 0) or 0),
+        "magnitude": props.get("mag"),
+        "latitude": coords[1],
+        "longitude": coords[0],
+        "depth_km": coords[2] if len(coords) > 2 else None,
+        "location_name": props.get("place", ""),
+        "url": props.get("url", ""),
+        # Kept as aware datetimes; the router serialises them with orjson
+        "timestamp": datetime.fromtimestamp(props["time"] / 1000, tz=UTC) if props.get("time") else None,
+        "updated": datetime.fromtimestamp(props["updated"] / 1000, tz=UTC) if props.get("updated") else None,
+    }
+
+
+def _eonet_event_to_event(event: dict) -> dict | None:
+    """Convert an EONET event using its latest geometry; None if it has no coordinates."""
+    geometries = event.get("geometry", [])
+    if not geometries:
+        return None
+    latest = geometries[-1]
+    coords = latest.get("coordinates", [0, 0])
+    if not coords or len(coords) < 2:
+        return None
+
+    cats = event.get("categories", [])
+    cat_id = cats[0].get("id", "other") if cats else "other"
+    dtype, default_sev = _EONET_CATEGORY_MAP.get(cat_id, ("other", "medium"))
+    return {
+        "id": f"eonet_{event.get('id', '')}",
+        "source": "NASA EONET",
+        "type": dtype,
+        "title": event.get("title", "Natural Event"),
+        "description": f"{event.get('title', '')} — tracked by NASA Earth Observatory",
+        "severity": default_sev,
+        "latitude": coords[1],
+        "longitude": coords[0],
+        "location_name": event.get("title", ""),
+        "url": event.get("link", ""),
+        "timestamp": latest.get("date", ""),
+    }
+
+
+def _gdacs_feature_to_event(feat: dict) -> dict | None:
+    """Convert a GDACS GeoJSON feature; None if it has no point coordinates."""
+    coords = feat.get("geometry", {}).get("coordinates", [0, 0])
+    if not (isinstance(coords, list) and len(coords) >= 2):
+        return None
+
+    props = feat.get("properties", {})
+    url = props.get("url", "")
+    population = props.get("population")
+    return {
+        "id": f"gdacs_{props.get('eventid', '')}_{props.get('episodeid', '')}",
+        "source": "GDACS",
+        "type": _GDACS_TYPE_MAP.get(props.get("eventtype", ""), "other"),
+        "title": props.get("htmldescription", props.get("name", "GDACS Alert")),
+        "description": props.get("description", ""),
+        "severity": _gdacs_severity(props.get("alertlevel", "Green")),
+        "latitude": coords[1],
+        "longitude": coords[0],
+        "location_name": props.get("country", props.get("name", "")),
+        "url": url.get("report", "") if isinstance(url, dict) else str(url),
+        "timestamp": props.get("fromdate", ""),
+        "alert_level": props.get("alertlevel", ""),
+        "affected_population": population.get("value") if isinstance(population, dict) else None,
+    }
+
+
+def _reliefweb_item_to_event(item: dict) -> dict:
+    fields = item.get("fields", {})
+    countries = fields.get("country", [])
+    iso = countries[0].get("iso3", "") if countries else ""
+    lat, lon = _RELIEFWEB_COUNTRY_COORDS.get(iso, (0, 0))
+    ptype = fields.get("primary_type", {})
+    type_name = ptype.get("name", "") if isinstance(ptype, dict) else str(ptype)
+    dates = fields.get("date")
+    return {
+        "id": f"rw_{item.get('id', '')}",
+        "source": "ReliefWeb",
+        "type": _RELIEFWEB_TYPE_MAP.get(type_name, "other"),
+        "title": fields.get("name", "Disaster"),
+        "description": fields.get("description", ""),
+        "severity": _reliefweb_severity(fields.get("status", "")),
+        "latitude": lat,
+        "longitude": lon,
+        "location_name": countries[0].get("name", "Unknown") if countries else "Unknown",
+        "url": fields.get("url", ""),
+        "timestamp": dates.get("event", "") if isinstance(dates, dict) else "",
+        "disaster_type_name": type_name,
+        "glide": fields.get("glide", ""),
+    }
+
+
 # ── Fetchers ──────────────────────────────────────────────────────────────
 
 
+async def _stream_json(client: httpx.AsyncClient, url: str, **kwargs):
+    """GET ``url`` and decode the streamed body straight from bytes.
+
+    Skips the intermediate ``str`` that ``Response.json()`` materialises.
+    """
+    async with client.stream("GET", url, **kwargs) as r:
+        r.raise_for_status()
+        body = bytearray()
+        async for chunk in r.aiter_bytes():
+            body += chunk
+    return orjson.loads(body)
+
+
 async def _fetch_usgs(client: httpx.AsyncClient) -> list[dict]:
     """USGS M4.5+ earthquakes – past 30 days."""
     url = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/4.5_month.geojson"
     try:
-        r = await client.get(url, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        results = []
-        for feat in data.get("features", []):
-            props = feat.get("properties", {})
-            coords = feat.get("geometry", {}).get("coordinates", [0, 0, 0])
-            results.append(
-                {
-                    "id": f"usgs_{feat.get('id', '')}",
-                    "source": "USGS",
-                    "type": "earthquake",
-                    "title": props.get("title", "Earthquake"),
-                    "description": f"Magnitude {props.get('mag', '?')} earthquake - {props.get('place', 'Unknown')}",
-                    "severity": _mag_to_severity(props.get("mag", 0) or 0),
-                    "magnitude": props.get("mag"),
-                    "latitude": coords[1],
-                    "longitude": coords[0],
-                    "depth_km": coords[2] if len(coords) > 2 else None,
-                    "location_name": props.get("place", ""),
-                    "url": props.get("url", ""),
-                    "timestamp": datetime.utcfromtimestamp(props.get("time", 0) / 1000).isoformat()
-                    if props.get("time")
-                    else None,
-                    "updated": datetime.utcfromtimestamp(props.get("updated", 0) / 1000).isoformat()
-                    if props.get("updated")
-                    else None,
-                }
-            )
+        data = await _stream_json(client, url, timeout=15)
+        results = [_usgs_feature_to_event(feat) for feat in data.get("features", [])]
         logger.info("USGS: fetched %d earthquakes", len(results))
         return results
     except Exception as e:
@@ -106,54 +357,8 @@ async def _fetch_eonet(client: httpx.AsyncClient) -> list[dict]:
     """NASA EONET – active natural events (wildfires, storms, volcanoes, etc.)."""
     url = "https://eonet.gsfc.nasa.gov/api/v3/events?status=open&limit=200"
     try:
-        r = await client.get(url, timeout=20)
-        r.raise_for_status()
-        data = r.json()
-        results = []
-        category_map = {
-            "wildfires": ("wildfire", "high"),
-            "volcanoes": ("volcanic_eruption", "critical"),
-            "severeStorms": ("cyclone", "high"),
-            "floods": ("flood", "high"),
-            "drought": ("drought", "medium"),
-            "dustHaze": ("other", "low"),
-            "earthquakes": ("earthquake", "high"),
-            "landslides": ("landslide", "high"),
-            "snow": ("other", "low"),
-            "tempExtremes": ("other", "medium"),
-            "waterColor": ("other", "low"),
-            "seaLakeIce": ("other", "low"),
-            "manmade": ("other", "medium"),
-        }
-        for event in data.get("events", []):
-            cats = event.get("categories", [])
-            cat_id = cats[0].get("id", "other") if cats else "other"
-            dtype, default_sev = category_map.get(cat_id, ("other", "medium"))
-
-            # Use latest geometry
-            geometries = event.get("geometry", [])
-            if not geometries:
-                continue
-            latest = geometries[-1]
-            coords = latest.get("coordinates", [0, 0])
-            if not coords or len(coords) < 2:
-                continue
-
-            results.append(
-                {
-                    "id": f"eonet_{event.get('id', '')}",
-                    "source": "NASA EONET",
-                    "type": dtype,
-                    "title": event.get("title", "Natural Event"),
-                    "description": f"{event.get('title', '')} — tracked by NASA Earth Observatory",
-                    "severity": default_sev,
-                    "latitude": coords[1],
-                    "longitude": coords[0],
-                    "location_name": event.get("title", ""),
-                    "url": event.get("link", ""),
-                    "timestamp": latest.get("date", ""),
-                }
-            )
+        data = await _stream_json(client, url, timeout=20)
+        results = [ev for ev in map(_eonet_event_to_event, data.get("events", [])) if ev is not None]
         logger.info("EONET: fetched %d events", len(results))
         return results
     except Exception as e:
@@ -168,49 +373,8 @@ async def _fetch_gdacs(client: httpx.AsyncClient) -> list[dict]:
     to_date = datetime.utcnow().strftime("%Y-%m-%d")
     url = url.format(from_date=from_date, to_date=to_date)
     try:
-        r = await client.get(url, timeout=20, headers={"Accept": "application/json"})
-        r.raise_for_status()
-        data = r.json()
-        results = []
-        type_map = {
-            "EQ": "earthquake",
-            "TC": "cyclone",
-            "FL": "flood",
-            "VO": "volcanic_eruption",
-            "DR": "drought",
-            "WF": "wildfire",
-        }
-        features = data.get("features", [])
-        for feat in features:
-            props = feat.get("properties", {})
-            geom = feat.get("geometry", {})
-            coords = geom.get("coordinates", [0, 0])
-            if isinstance(coords, list) and len(coords) >= 2:
-                lon, lat = coords[0], coords[1]
-            else:
-                continue
-            etype = type_map.get(props.get("eventtype", ""), "other")
-            results.append(
-                {
-                    "id": f"gdacs_{props.get('eventid', '')}_{props.get('episodeid', '')}",
-                    "source": "GDACS",
-                    "type": etype,
-                    "title": props.get("htmldescription", props.get("name", "GDACS Alert")),
-                    "description": props.get("description", ""),
-                    "severity": _gdacs_severity(props.get("alertlevel", "Green")),
-                    "latitude": lat,
-                    "longitude": lon,
-                    "location_name": props.get("country", props.get("name", "")),
-                    "url": props.get("url", {}).get("report", "")
-                    if isinstance(props.get("url"), dict)
-                    else str(props.get("url", "")),
-                    "timestamp": props.get("fromdate", ""),
-                    "alert_level": props.get("alertlevel", ""),
-                    "affected_population": props.get("population", {}).get("value")
-                    if isinstance(props.get("population"), dict)
-                    else None,
-                }
-            )
+        data = await _stream_json(client, url, timeout=20, headers={"Accept": "application/json"})
+        results = [ev for ev in map(_gdacs_feature_to_event, data.get("features", [])) if ev is not None]
         logger.info("GDACS: fetched %d events", len(results))
         return results
     except Exception as e:
@@ -249,113 +413,7 @@ async def _fetch_reliefweb(client: httpx.AsyncClient) -> list[dict]:
         r = await client.post(url, json=payload, timeout=15)
         r.raise_for_status()
         data = r.json()
-        results = []
-        type_map = {
-            "Earthquake": "earthquake",
-            "Flood": "flood",
-            "Tropical Cyclone": "cyclone",
-            "Volcano": "volcanic_eruption",
-            "Drought": "drought",
-            "Epidemic": "epidemic",
-            "Storm": "cyclone",
-            "Flash Flood": "flood",
-            "Wild Fire": "wildfire",
-            "Cold Wave": "other",
-            "Heat Wave": "other",
-            "Insect Infestation": "other",
-            "Tsunami": "tsunami",
-            "Landslide": "landslide",
-            "Mud Slide": "landslide",
-            "Technological Disaster": "other",
-            "Complex Emergency": "other",
-        }
-        # Country center coords (rough estimates for mapping)
-        country_coords = {
-            "AFG": (33.9, 67.7),
-            "BGD": (23.7, 90.4),
-            "BRA": (-14.2, -51.9),
-            "CHN": (35.9, 104.2),
-            "COL": (4.6, -74.1),
-            "COD": (-4.0, 21.8),
-            "ETH": (9.1, 40.5),
-            "GTM": (15.8, -90.2),
-            "HTI": (19.0, -72.4),
-            "IND": (20.6, 78.9),
-            "IDN": (-0.8, 113.9),
-            "IRN": (32.4, 53.7),
-            "IRQ": (33.2, 43.7),
-            "JPN": (36.2, 138.3),
-            "KEN": (-0.02, 37.9),
-            "MEX": (23.6, -102.6),
-            "MMR": (21.9, 95.9),
-            "NPL": (28.4, 84.1),
-            "NGA": (9.1, 8.7),
-            "PAK": (30.4, 69.3),
-            "PHL": (12.9, 121.8),
-            "SOM": (5.2, 46.2),
-            "LKA": (7.9, 80.8),
-            "SDN": (12.9, 30.2),
-            "SYR": (34.8, 38.9),
-            "TUR": (38.9, 35.2),
-            "UKR": (48.4, 31.2),
-            "USA": (37.1, -95.7),
-            "VNM": (14.1, 108.3),
-            "YEM": (15.6, 48.5),
-            "AUS": (-25.3, 133.8),
-            "CHL": (-35.7, -71.5),
-            "PER": (-9.2, -75.0),
-            "ECU": (-1.8, -78.2),
-            "NZL": (-40.9, 174.9),
-            "FJI": (-17.7, 178.1),
-            "MOZ": (-18.7, 35.5),
-            "MDG": (-18.8, 46.9),
-            "ZAF": (-30.6, 22.9),
-            "TZA": (-6.4, 34.9),
-            "UGA": (1.4, 32.3),
-            "MWI": (-13.3, 34.3),
-            "ZMB": (-13.1, 27.8),
-            "ZWE": (-19.0, 29.2),
-            "AGO": (-11.2, 17.9),
-            "CMR": (7.4, 12.4),
-            "GHA": (7.9, -1.0),
-            "SEN": (14.5, -14.5),
-            "MLI": (17.6, -4.0),
-            "NER": (17.6, 8.1),
-            "TCD": (15.5, 18.7),
-            "CAF": (6.6, 20.9),
-            "RWA": (-1.9, 29.9),
-            "BDI": (-3.4, 29.9),
-        }
-        for item in data.get("data", []):
-            fields = item.get("fields", {})
-            countries = fields.get("country", [])
-            iso = countries[0].get("iso3", "") if countries else ""
-            country_name = countries[0].get("name", "Unknown") if countries else "Unknown"
-            lat, lon = country_coords.get(iso, (0, 0))
-            ptype = fields.get("primary_type", {})
-            type_name = ptype.get("name", "") if isinstance(ptype, dict) else str(ptype)
-            dtype = type_map.get(type_name, "other")
-            status = fields.get("status", "")
-
-            results.append(
-                {
-                    "id": f"rw_{item.get('id', '')}",
-                    "source": "ReliefWeb",
-                    "type": dtype,
-                    "title": fields.get("name", "Disaster"),
-                    "description": fields.get("description", ""),
-                    "severity": _reliefweb_severity(status),
-                    "latitude": lat,
-                    "longitude": lon,
-                    "location_name": country_name,
-                    "url": fields.get("url", ""),
-                    "timestamp": fields.get("date", {}).get("event", "")
-                    if isinstance(fields.get("date"), dict)
-                    else "",
-                    "disaster_type_name": type_name,
-                    "glide": fields.get("glide", ""),
-                }
-            )
+        results = [_reliefweb_item_to_event(item) for item in data.get("data", [])]
         logger.info("ReliefWeb: fetched %d disasters", len(results))
         return results
     except Exception as e:
@@ -365,6 +423,33 @@ async def _fetch_reliefweb(client: httpx.AsyncClient) -> list[dict]:
 
 # ── Public aggregator ─────────────────────────────────────────────────────
 
+_Fetcher = Callable[[httpx.AsyncClient], Awaitable[list[dict]]]
+
+_FETCHERS: tuple[tuple[str, _Fetcher], ...] = (
+    ("usgs", _fetch_usgs),
+    ("eonet", _fetch_eonet),
+    ("gdacs", _fetch_gdacs),
+    ("reliefweb", _fetch_reliefweb),
+)
+
+# Hard ceiling per upstream so one hung source cannot stall the aggregate
+FETCH_TIMEOUT_SECONDS = 10.0
+# Bounds concurrent upstream fetches across overlapping aggregate calls
+_fetch_semaphore = asyncio.Semaphore(8)
+
+
+async def _fetch_bounded(fetch: _Fetcher, client: httpx.AsyncClient) -> list[dict] | Exception:
+    """Run one fetcher under the shared semaphore and hard timeout.
+
+    Failures are returned rather than raised so the TaskGroup never cancels
+    the sibling fetches.
+    """
+    async with _fetch_semaphore:
+        try:
+            return await asyncio.wait_for(fetch(client), timeout=FETCH_TIMEOUT_SECONDS)
+        except Exception as e:
+            return e
+
 
 async def get_global_disasters(
     source: str | None = None,
@@ -382,86 +467,68 @@ async def get_global_disasters(
     if cached:
         return cached
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        tasks = []
-        if not source or source == "usgs":
-            tasks.append(_fetch_usgs(client))
-        if not source or source == "eonet":
-            tasks.append(_fetch_eonet(client))
-        if not source or source == "gdacs":
-            tasks.append(_fetch_gdacs(client))
-        if not source or source == "reliefweb":
-            tasks.append(_fetch_reliefweb(client))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    client = get_client()
+    selected = [(name, fetch) for name, fetch in _FETCHERS if not source or source == name]
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_fetch_bounded(fetch, client)) for _, fetch in selected]
 
     all_events: list[dict] = []
     sources_status: dict = {}
-    source_names = []
-    if not source or source == "usgs":
-        source_names.append("usgs")
-    if not source or source == "eonet":
-        source_names.append("eonet")
-    if not source or source == "gdacs":
-        source_names.append("gdacs")
-    if not source or source == "reliefweb":
-        source_names.append("reliefweb")
-
-    for i, res in enumerate(results):
-        name = source_names[i] if i < len(source_names) else f"source_{i}"
-        if isinstance(res, Exception):
+    for (name, _), task in zip(selected, tasks):
+        res = task.result()
+        if isinstance(res, TimeoutError):
+            logger.warning("%s fetch timed out after %gs", name, FETCH_TIMEOUT_SECONDS)
+            sources_status[name] = {"status": "timeout", "count": 0}
+        elif isinstance(res, Exception):
             sources_status[name] = {"status": "error", "count": 0, "error": str(res)}
         else:
             sources_status[name] = {"status": "ok", "count": len(res)}
             all_events.extend(res)
 
-    # Filter by type
+    # Filter by type / severity and drop events without coordinates using
+    # column-wise boolean masks built once over all events
+    n = len(all_events)
+    lats = np.fromiter((e.get("latitude") or 0 for e in all_events), dtype=np.float64, count=n)
+    lons = np.fromiter((e.get("longitude") or 0 for e in all_events), dtype=np.float64, count=n)
+    mask = (lats != 0) & (lons != 0)
     if disaster_type:
-        all_events = [e for e in all_events if e.get("type") == disaster_type]
-
-    # Filter by severity
+        mask &= np.fromiter((e.get("type") == disaster_type for e in all_events), dtype=bool, count=n)
     if severity:
-        all_events = [e for e in all_events if e.get("severity") == severity]
-
-    # Filter out events without coordinates
-    all_events = [e for e in all_events if e.get("latitude") and e.get("longitude")]
-
-    # Sort by timestamp desc
-    _DATETIME_MIN_UTC = datetime.min.replace(tzinfo=UTC)
-
-    def sort_key(e):
-        ts = e.get("timestamp", "")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                # Ensure timezone-aware
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-                return dt
-            except Exception:
-                pass
-        return _DATETIME_MIN_UTC
-
-    all_events.sort(key=sort_key, reverse=True)
-    all_events = all_events[:limit]
+        mask &= np.fromiter((e.get("severity") == severity for e in all_events), dtype=bool, count=n)
+    all_events = [all_events[i] for i in np.flatnonzero(mask)]
+
+    # Sort by timestamp desc, keeping only the newest ``limit`` events. When the
+    # limit cuts the list, select the top-K with argpartition (O(N)) and only
+    # sort those; lexsort on the index keeps equal timestamps in feed order.
+    neg_ts = -np.fromiter(
+        (_event_datetime(e.get("timestamp")).timestamp() for e in all_events),
+        dtype=np.float64,
+        count=len(all_events),
+    )
+    if len(all_events) > limit:
+        idx = np.argpartition(neg_ts, limit - 1)[:limit]
+        idx = idx[np.lexsort((idx, neg_ts[idx]))]
+    else:
+        idx = np.argsort(neg_ts, kind="stable")
+    all_events = [all_events[i] for i in idx]
 
     # Compute summary stats
-    by_type: dict[str, int] = {}
-    by_severity: dict[str, int] = {}
-    by_source: dict[str, int] = {}
+    by_type: Counter[str] = Counter()
+    by_severity: Counter[str] = Counter()
+    by_source: Counter[str] = Counter()
     for e in all_events:
-        by_type[e.get("type", "other")] = by_type.get(e.get("type", "other"), 0) + 1
-        by_severity[e.get("severity", "medium")] = by_severity.get(e.get("severity", "medium"), 0) + 1
-        by_source[e.get("source", "unknown")] = by_source.get(e.get("source", "unknown"), 0) + 1
+        by_type[e.get("type", "other")] += 1
+        by_severity[e.get("severity", "medium")] += 1
+        by_source[e.get("source", "unknown")] += 1
 
     result = {
         "events": all_events,
         "total": len(all_events),
         "sources": sources_status,
         "stats": {
-            "by_type": by_type,
-            "by_severity": by_severity,
-            "by_source": by_source,
+            "by_type": dict(by_type),
+            "by_severity": dict(by_severity),
+            "by_source": dict(by_source),
         },
         "fetched_at": datetime.now(UTC).isoformat(),
     }
@@ -10,6 +10,8 @@ Logs every notification attempt in the alert_notifications table.
 
 from __future__ import annotations
 
+import asyncio
+import html
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -23,6 +25,13 @@ from app.services.ingestion import memory_store
 
 logger = logging.getLogger("ingestion.alerts")
 
+# SendGrid accepts at most 1000 personalizations per /mail/send request
+_SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+# Caps concurrent SendGrid requests across all alert evaluations
+_SENDGRID_CONCURRENCY = 10
+_sendgrid_semaphore = asyncio.Semaphore(_SENDGRID_CONCURRENCY)
+
 
 class AlertNotificationService:
     """Dispatches critical-severity notifications via email (SendGrid free tier)."""
@@ -48,16 +57,44 @@ class AlertNotificationService:
             logger.warning("No NGO/admin recipients configured for alerts")
             return []
 
+        subject = f"🚨 CRITICAL ALERT: {event.get('title', 'Disaster Event')}"
+        body = self._build_body(event)
+        html_body = self._html_body(subject, body)
+
+        # One SendGrid request covers up to 1000 email recipients (one personalization
+        # each); larger lists are split into batches dispatched concurrently
+        email_results: dict[str, dict[str, Any]] = {}
+        if cfg.SENDGRID_API_KEY:
+            emails = list(dict.fromkeys(r["email"] for r in recipients if r.get("email")))
+            batches = [
+                emails[start : start + _SENDGRID_MAX_PERSONALIZATIONS]
+                for start in range(0, len(emails), _SENDGRID_MAX_PERSONALIZATIONS)
+            ]
+            results = await asyncio.gather(
+                *(self._send_email_bounded(batch, subject, body, html_body) for batch in batches),
+                return_exceptions=True,
+            )
+            for batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logger.error("SendGrid batch of %d failed: %s", len(batch), result)
+                    result = {"status": "failed", "error": str(result)}
+                email_results.update(dict.fromkeys(batch, result))
+
         notifications: list[dict[str, Any]] = []
         for recip in recipients:
-            notif = await self._send(
+            notif = self._send(
                 event=event,
                 disaster_id=disaster_id,
                 prediction_id=prediction_id,
                 recipient=recip,
+                subject=subject,
+                body=body,
+                email_result=email_results.get(recip.get("email") or ""),
             )
             notifications.append(notif)
 
+        # Persist the whole notification log in one store write
+        memory_store.add_alert_notifications(notifications)
         return notifications
 
     # ── private ─────────────────────────────────────────────────────
@@ -72,17 +109,18 @@ class AlertNotificationService:
         )
         return resp.data or []
 
-    async def _send(
+    def _send(
         self,
         event: dict[str, Any],
         disaster_id: str | None,
         prediction_id: str | None,
         recipient: dict[str, Any],
+        subject: str,
+        body: str,
+        email_result: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        """Attempt email dispatch for one recipient, with log fallback."""
+        """Record the email outcome for one recipient, with log fallback."""
         notif_id = str(uuid4())
-        subject = f"🚨 CRITICAL ALERT: {event.get('title', 'Disaster Event')}"
-        body = self._build_body(event)
 
         notif_base = {
             "id": notif_id,
@@ -98,15 +136,14 @@ class AlertNotificationService:
             "created_at": datetime.now(UTC).isoformat(),
         }
 
-        # Try email via SendGrid (free tier: 100 emails/day)
+        # Email via SendGrid (free tier: 100 emails/day), dispatched in bulk by the caller
         email = recipient.get("email")
-        if email and cfg.SENDGRID_API_KEY:
-            result = await self._send_email(email, subject, body)
+        if email_result is not None:
             notif_base["channel"] = "email"
-            notif_base["external_ref"] = result.get("message_id")
-            notif_base["status"] = result.get("status", "failed")
-            notif_base["error_message"] = result.get("error")
-            if result.get("status") == "sent":
+            notif_base["external_ref"] = email_result.get("message_id")
+            notif_base["status"] = email_result.get("status", "failed")
+            notif_base["error_message"] = email_result.get("error")
+            if email_result.get("status") == "sent":
                 notif_base["sent_at"] = datetime.now(UTC).isoformat()
         else:
             # Log-based fallback — alert is persisted in DB for dashboard visibility
@@ -119,25 +156,30 @@ class AlertNotificationService:
                 email or "(no email)",
             )
 
-        # Persist notification log (in-memory)
-        memory_store.add_alert_notification(notif_base)
         return notif_base
 
     # ── Email via SendGrid ──────────────────────────────────────────
 
-    async def _send_email(self, to_email: str, subject: str, body: str) -> dict[str, Any]:
+    async def _send_email_bounded(
+        self, to_emails: list[str], subject: str, body: str, html_body: str
+    ) -> dict[str, Any]:
+        async with _sendgrid_semaphore:
+            return await self._send_email(to_emails, subject, body, html_body)
+
+    async def _send_email(self, to_emails: list[str], subject: str, body: str, html_body: str) -> dict[str, Any]:
+        """Send one SendGrid request; each address gets its own personalization."""
         url = "https://api.sendgrid.com/v3/mail/send"
         headers = {
             "Authorization": f"Bearer {cfg.SENDGRID_API_KEY}",
             "Content-Type": "application/json",
         }
         payload = {
-            "personalizations": [{"to": [{"email": to_email}]}],
+            "personalizations": [{"to": [{"email": email}]} for email in to_emails],
             "from": {"email": cfg.SENDGRID_FROM_EMAIL, "name": "Disaster Management Alerts"},
             "subject": subject,
             "content": [
                 {"type": "text/plain", "value": body},
-                {"type": "text/html", "value": self._html_body(subject, body)},
+                {"type": "text/html", "value": html_body},
             ],
         }
 
@@ -146,7 +188,7 @@ class AlertNotificationService:
                 resp = await client.post(url, json=payload, headers=headers)
             if resp.status_code in (200, 201, 202):
                 msg_id = resp.headers.get("X-Message-Id", "")
-                logger.info("Email sent to %s (msg_id=%s)", to_email, msg_id)
+                logger.info("Email sent to %d recipient(s) (msg_id=%s)", len(to_emails), msg_id)
                 return {"status": "sent", "message_id": msg_id}
             else:
                 err = resp.text[:300]
@@ -159,26 +201,25 @@ class AlertNotificationService:
     # ── Body formatting ─────────────────────────────────────────────
 
     def _build_body(self, event: dict[str, Any]) -> str:
-        lines = [
+        lat, lon = event.get("latitude"), event.get("longitude")
+        place = event.get("location_name")
+        description = event.get("description")
+        lines = (
             "CRITICAL DISASTER ALERT",
             "",
             f"Event: {event.get('title', 'Unknown')}",
             f"Severity: {event.get('severity', 'N/A').upper()}",
             f"Type: {event.get('event_type', 'N/A')}",
-        ]
-        if event.get("latitude") and event.get("longitude"):
-            lines.append(f"Location: {event.get('latitude'):.4f}, {event.get('longitude'):.4f}")
-        if event.get("location_name"):
-            lines.append(f"Place: {event.get('location_name')}")
-        if event.get("description"):
-            lines.append("")
-            lines.append(event["description"][:500])
-        lines.append("")
-        lines.append("Please log in to the Disaster Management Platform for full details.")
-        return "\n".join(lines)
+            f"Location: {lat:.4f}, {lon:.4f}" if lat and lon else None,
+            f"Place: {place}" if place else None,
+            f"\n{description[:500]}" if description else None,
+            "",
+            "Please log in to the Disaster Management Platform for full details.",
+        )
+        return "\n".join(line for line in lines if line is not None)
 
     def _html_body(self, subject: str, plain_body: str) -> str:
-        escaped = plain_body.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        escaped = html.escape(plain_body, quote=False)
         return f"""
         <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
             <div style="background: #dc2626; color: white; padding: 16px; border-radius: 8px 8px 0 0;">
@@ -7,21 +7,76 @@ the satellite_observations table.  Results feed the spread predictor.
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
+import itertools
 import logging
 from datetime import UTC, datetime
-from typing import Any
-from uuid import uuid4
-
-import httpx
+from typing import Any, NamedTuple
 
 from app.core.config import ingestion_config as cfg
+from app.core.helpers import uuid4_batch
+from app.core.http import get_client
 from app.services.ingestion import memory_store
 from app.services.ingestion.mock_data_service import generate_mock_fire_hotspots
 
+# pyarrow's multithreaded C++ CSV reader handles large FIRMS dumps far faster
+# than csv.DictReader; the row-by-row parser remains as the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+
 logger = logging.getLogger("ingestion.firms")
 
+# Confidence labels kept as-is; anything else (e.g. MODIS percentages) maps to None
+_CONFIDENCE_LEVELS = frozenset({"low", "nominal", "high"})
+
+# World-wide polls are split into these "west,south,east,north" tiles and
+# fetched concurrently; FIRMS serves each area request independently.  Note
+# that each tile is a separate FIRMS transaction, so a world poll costs
+# len(_WORLD_TILES) requests against the per-key transaction budget.
+_WORLD_TILES = (
+    "-180,-90,-90,0",
+    "-90,-90,0,0",
+    "0,-90,90,0",
+    "90,-90,180,0",
+    "-180,0,-90,90",
+    "-90,0,0,90",
+    "0,0,90,90",
+    "90,0,180,90",
+)
+
+# At most this many FIRMS requests in flight at once (NASA rate-limits per API key)
+_fetch_semaphore = asyncio.Semaphore(3)
+
+if _HAS_ARROW:
+    _CONFIDENCE_VALUE_SET = pa.array(sorted(_CONFIDENCE_LEVELS))
+    _NULL_STRING = pa.scalar(None, pa.string())
+
+
+class FirmsRow(NamedTuple):
+    """A parsed FIRMS hotspot; only rows that turn out to be new become dicts."""
+
+    id: str
+    source: str
+    external_id: str
+    latitude: float
+    longitude: float
+    brightness: float | None
+    frp: float | None
+    confidence: str | None
+    satellite: str
+    instrument: str
+    acq_datetime: str
+    daynight: str
+    raw_payload: dict[str, Any]
+
 
 class FIRMSService:
     """Polls NASA FIRMS CSV API for fire hotspot observations."""
@@ -45,13 +100,27 @@ class FIRMSService:
         if not self.api_key:
             logger.info("No FIRMS_API_KEY – using mock fire hotspot data")
             hotspots = generate_mock_fire_hotspots()
-            stored = await self._store_observations(hotspots)
+            stored = memory_store.add_satellite_observations(hotspots)
             logger.info("Mock FIRMS poll complete – %d hotspots stored", len(stored))
             return stored
 
         try:
-            csv_text = await self._fetch_csv(bbox, days)
-            hotspots = self._parse_csv(csv_text)
+            if bbox:
+                bodies = [await self._fetch_csv(bbox, days)]
+            else:
+                # A failed tile only loses its own area; the others are still parsed
+                results = await asyncio.gather(
+                    *(self._fetch_csv(tile, days) for tile in _WORLD_TILES), return_exceptions=True
+                )
+                bodies = [r for r in results if not isinstance(r, BaseException)]
+                failed = len(results) - len(bodies)
+                if not bodies:
+                    raise results[0]
+                if failed:
+                    logger.warning("FIRMS: %d of %d world tiles failed", failed, len(results))
+            # Parsing is the only CPU-heavy step; keep it off the event loop.
+            # Points on a tile edge may come back twice; the store drops repeats.
+            hotspots = [h for body in bodies for h in await asyncio.to_thread(self._parse_csv, body)]
             stored = await self._store_observations(hotspots)
             logger.info("FIRMS poll complete – %d hotspots stored", len(stored))
             return stored
@@ -61,7 +130,7 @@ class FIRMSService:
 
     # ── internals ───────────────────────────────────────────────────
 
-    async def _fetch_csv(self, bbox: str | None, days: int) -> str:
+    async def _fetch_csv(self, bbox: str | None, days: int) -> bytes:
         # FIRMS CSV endpoint:
         # https://firms.modaps.eosdis.nasa.gov/api/area/csv/{API_KEY}/{SOURCE}/{BBOX}/{DAYS}
         parts = [self.base_url, self.api_key, self.source]
@@ -72,16 +141,110 @@ class FIRMSService:
         parts.append(str(days))
         url = "/".join(parts)
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.get(url)
+        # Stream into a single bytes buffer; the parsers read it without ever
+        # materialising the body as a decoded str
+        body = bytearray()
+        async with _fetch_semaphore, get_client().stream("GET", url, timeout=60) as resp:
             resp.raise_for_status()
-            return resp.text
+            async for chunk in resp.aiter_bytes():
+                body += chunk
+        return bytes(body)
 
-    def _parse_csv(self, csv_text: str) -> list[dict[str, Any]]:
-        reader = csv.DictReader(io.StringIO(csv_text))
-        results: list[dict[str, Any]] = []
+    def _parse_csv(self, data: bytes) -> list[FirmsRow]:
+        if _HAS_ARROW:
+            try:
+                return self._parse_csv_arrow(data)
+            except (pa.ArrowInvalid, KeyError):
+                logger.debug("Arrow FIRMS parse failed – falling back to row parser", exc_info=True)
+        return self._parse_csv_rows(data)
+
+    def _parse_csv_arrow(self, data: bytes) -> list[FirmsRow]:
+        """Columnar parse: text read, then vectorised casts and timestamp construction."""
+        # Every column is read as text so raw_payload holds the same strings the
+        # row parser's DictReader yields, and external_id keeps the upstream digits
+        header = data.split(b"\n", 1)[0].decode().strip().split(",")
+        column_types = dict.fromkeys(header, pa.string())
+        table = pa_csv.read_csv(io.BytesIO(data), convert_options=pa_csv.ConvertOptions(column_types=column_types))
+
+        # Rows without coordinates are unusable (the row parser skips them too)
+        table = table.filter(pc.and_(pc.not_equal(table["latitude"], ""), pc.not_equal(table["longitude"], "")))
+        n = table.num_rows
+        if n == 0:
+            return []
 
-        for row in reader:
+        # FIRMS can drop the leading zero of acq_time ("930"); pad to HHMM
+        acq_time = pc.utf8_lpad(table["acq_time"], width=4, padding="0")
+
+        # Adjacent scans can report the same hotspot twice; keep the first row
+        # per external_id so duplicates never become Python dicts
+        external_ids = pc.binary_join_element_wise(
+            "firms", table["latitude"], table["longitude"], table["acq_date"], acq_time, "-"
+        )
+        first_rows = (
+            pa.table({"external_id": external_ids, "row": pa.array(range(n), pa.int64())})
+            .group_by("external_id", use_threads=False)
+            .aggregate([("row", "min")])["row_min"]
+        )
+        if len(first_rows) < n:
+            keep = pc.take(first_rows, pc.sort_indices(first_rows))
+            table = table.take(keep)
+            external_ids = external_ids.take(keep)
+            acq_time = acq_time.take(keep)
+            n = table.num_rows
+
+        acq_ts = pc.strptime(
+            pc.binary_join_element_wise(table["acq_date"], acq_time, " "),
+            format="%Y-%m-%d %H%M",
+            unit="s",
+            error_is_null=True,
+        )
+        acq_iso = pc.fill_null(
+            pc.strftime(acq_ts, format="%Y-%m-%dT%H:%M:%S+00:00"),
+            datetime.now(UTC).isoformat(),
+        )
+        if "confidence" in table.column_names:
+            lowered = pc.utf8_lower(table["confidence"])
+            confidence = pc.if_else(pc.is_in(lowered, value_set=_CONFIDENCE_VALUE_SET), lowered, _NULL_STRING)
+        else:
+            confidence = pa.nulls(n, pa.string())
+
+        def floats(name: str) -> pa.ChunkedArray:
+            # Empty cells become null, matching _float_or_none
+            col = table[name]
+            return pc.cast(pc.if_else(pc.equal(col, ""), _NULL_STRING, col), pa.float64())
+
+        brightness_cols = [floats(c) for c in ("bright_ti4", "brightness") if c in table.column_names]
+        brightness = pc.coalesce(*brightness_cols) if brightness_cols else pa.nulls(n, pa.float64())
+        frp = floats("frp") if "frp" in table.column_names else pa.nulls(n, pa.float64())
+
+        def column(name: str, default: Any = None) -> list[Any]:
+            return table[name].to_pylist() if name in table.column_names else [default] * n
+
+        return list(
+            map(
+                FirmsRow,
+                uuid4_batch(n),
+                itertools.repeat("firms", n),
+                external_ids.to_pylist(),
+                pc.cast(table["latitude"], pa.float64()).to_pylist(),
+                pc.cast(table["longitude"], pa.float64()).to_pylist(),
+                brightness.to_pylist(),
+                frp.to_pylist(),
+                confidence.to_pylist(),
+                column("satellite", ""),
+                column("instrument", ""),
+                acq_iso.to_pylist(),
+                column("daynight", ""),
+                table.to_pylist(),
+            )
+        )
+
+    def _parse_csv_rows(self, data: bytes) -> list[FirmsRow]:
+        rows = list(csv.DictReader(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", newline="")))
+        results: list[FirmsRow] = []
+        seen_ids: set[str] = set()
+
+        for obs_id, row in zip(uuid4_batch(len(rows)), rows):
             try:
                 lat = float(row.get("latitude", 0))
                 lon = float(row.get("longitude", 0))
@@ -91,40 +254,58 @@ class FIRMSService:
                 satellite = row.get("satellite", "")
                 instrument = row.get("instrument", "")
                 acq_date = row.get("acq_date", "")
-                acq_time = row.get("acq_time", "0000")
+                # FIRMS can drop the leading zero of acq_time ("930"); pad to HHMM
+                acq_time = row.get("acq_time", "0000").zfill(4)
                 daynight = row.get("daynight", "")
 
-                # Build datetime from acq_date + acq_time
+                # Build datetime from acq_date (YYYY-MM-DD) + acq_time (HHMM) by
+                # slicing – far cheaper than strptime for this fixed layout
                 try:
-                    acq_dt = datetime.strptime(f"{acq_date} {acq_time}", "%Y-%m-%d %H%M").replace(tzinfo=UTC)
+                    acq_dt = datetime(
+                        int(acq_date[:4]),
+                        int(acq_date[5:7]),
+                        int(acq_date[8:10]),
+                        int(acq_time[:2]),
+                        int(acq_time[2:4]),
+                        tzinfo=UTC,
+                    )
                 except ValueError:
                     acq_dt = datetime.now(UTC)
 
+                # Skip repeats of a hotspot already seen earlier in this dump
+                external_id = f"firms-{row.get('latitude', '')}-{row.get('longitude', '')}-{acq_date}-{acq_time}"
+                if external_id in seen_ids:
+                    continue
+                seen_ids.add(external_id)
+
                 results.append(
-                    {
-                        "id": str(uuid4()),
-                        "source": "firms",
-                        "external_id": f"firms-{lat}-{lon}-{acq_date}-{acq_time}",
-                        "latitude": lat,
-                        "longitude": lon,
-                        "brightness": brightness,
-                        "frp": frp,
-                        "confidence": confidence if confidence in ("low", "nominal", "high") else None,
-                        "satellite": satellite,
-                        "instrument": instrument,
-                        "acq_datetime": acq_dt.isoformat(),
-                        "daynight": daynight,
-                        "raw_payload": dict(row),
-                    }
+                    FirmsRow(
+                        id=obs_id,
+                        source="firms",
+                        external_id=external_id,
+                        latitude=lat,
+                        longitude=lon,
+                        brightness=brightness,
+                        frp=frp,
+                        confidence=confidence if confidence in _CONFIDENCE_LEVELS else None,
+                        satellite=satellite,
+                        instrument=instrument,
+                        acq_datetime=acq_dt.isoformat(),
+                        daynight=daynight,
+                        # DictReader yields a fresh dict per row, so no copy is needed
+                        raw_payload=row,
+                    )
                 )
             except Exception:
                 logger.debug("Skipping unparseable FIRMS row: %s", row)
 
         return results
 
-    async def _store_observations(self, observations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def _store_observations(self, observations: list[FirmsRow]) -> list[dict[str, Any]]:
         """Batch-insert into in-memory satellite store, skipping duplicates."""
-        return memory_store.add_satellite_observations(observations)
+        # Most hotspots repeat across polls; only build dicts for the new ones
+        fresh = memory_store.unseen_satellite_ids([o.external_id for o in observations])
+        return memory_store.add_satellite_observations([o._asdict() for o in observations if o.external_id in fresh])
 
     @staticmethod
     def _float_or_none(val: Any) -> float | None:
@@ -141,14 +322,8 @@ class FIRMSService:
         Summarise recent satellite observations near a coordinate.
         Useful as spread-predictor input.
         """
-        rows = memory_store.query_satellites(
-            lat_range=(lat - radius_deg, lat + radius_deg),
-            lon_range=(lon - radius_deg, lon + radius_deg),
+        return memory_store.summarize_satellites(
+            (lat - radius_deg, lat + radius_deg),
+            (lon - radius_deg, lon + radius_deg),
             limit=100,
         )
-        return {
-            "hotspot_count": len(rows),
-            "avg_frp": (sum(r.get("frp", 0) or 0 for r in rows) / len(rows)) if rows else 0,
-            "max_brightness": max((r.get("brightness", 0) or 0 for r in rows), default=0),
-            "latest": rows[0] if rows else None,
-        }
@@ -7,15 +7,16 @@ records when Orange/Red alerts are detected.
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import xml.etree.ElementTree as ET
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
-
-import httpx
 
 from app.core.config import ingestion_config as cfg
+from app.core.helpers import uuid4_batch
+from app.core.http import get_client
 from app.services.ingestion import memory_store
 from app.services.ingestion.mock_data_service import generate_mock_gdacs_events
 
@@ -28,6 +29,15 @@ GDACS_NS = {
     "dc": "http://purl.org/dc/elements/1.1/",
 }
 
+# Namespaced child tags in Clark notation, as they appear on parsed elements
+_TAG_EVENTTYPE = f"{{{GDACS_NS['gdacs']}}}eventtype"
+_TAG_ALERTLEVEL = f"{{{GDACS_NS['gdacs']}}}alertlevel"
+_TAG_EVENTID = f"{{{GDACS_NS['gdacs']}}}eventid"
+_TAG_SEVERITY = f"{{{GDACS_NS['gdacs']}}}severity"
+_TAG_POPULATION = f"{{{GDACS_NS['gdacs']}}}population"
+_TAG_LAT = f"{{{GDACS_NS['geo']}}}lat"
+_TAG_LONG = f"{{{GDACS_NS['geo']}}}long"
+
 # GDACS event type → our DisasterType mapping
 _TYPE_MAP: dict[str, str] = {
     "EQ": "earthquake",
@@ -52,6 +62,10 @@ class GDACSService:
 
     def __init__(self) -> None:
         self.feed_url = cfg.GDACS_RSS_URL
+        self._source_id: str | None = None
+        # Validators from the last 200 response, sent back as conditional headers
+        self._etag: str | None = None
+        self._last_modified: str | None = None
 
     async def poll(self) -> list[dict[str, Any]]:
         """
@@ -60,12 +74,21 @@ class GDACSService:
         Returns list of newly stored event dicts.
         """
         try:
-            xml_text = await self._fetch_feed()
-            items = self._parse_feed(xml_text)
+            fetched = await self._fetch_feed()
+            if fetched is None:
+                logger.info("GDACS feed not modified since last poll")
+                return []
+            xml_bytes, etag, last_modified = fetched
+            # Parsing is the only CPU-heavy step; keep it off the event loop
+            items = await asyncio.to_thread(self._parse_feed, xml_bytes)
             if not items:
                 logger.info("GDACS feed returned 0 items – generating mock events")
                 items = generate_mock_gdacs_events()
             new_events = await self._deduplicate_and_store(items)
+            # Only now is this feed version fully ingested; remembering the
+            # validators earlier would turn a failed parse into a 304 next poll
+            self._etag = etag
+            self._last_modified = last_modified
             logger.info("GDACS poll complete – %d new alerts ingested", len(new_events))
             return new_events
         except Exception:
@@ -77,41 +100,63 @@ class GDACSService:
 
     # ── internals ───────────────────────────────────────────────────
 
-    async def _fetch_feed(self) -> str:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(self.feed_url)
-            resp.raise_for_status()
-            return resp.text
+    async def _fetch_feed(self) -> tuple[bytes, str | None, str | None] | None:
+        """Conditional GET of the feed.
 
-    def _parse_feed(self, xml_text: str) -> list[dict[str, Any]]:
-        root = ET.fromstring(xml_text)
+        Returns ``(body, etag, last_modified)``, or None on 304 Not Modified.
+        The validators are left for the caller to keep once the body is stored.
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        resp = await get_client().get(self.feed_url, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        return resp.content, resp.headers.get("etag"), resp.headers.get("last-modified")
+
+    def _parse_feed(self, xml_bytes: bytes) -> list[dict[str, Any]]:
+        """Stream-parse the feed, clearing each <item> once it has been read."""
         items: list[dict[str, Any]] = []
 
-        for item in root.findall(".//item"):
+        for _, item in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            if item.tag != "item":
+                continue
             try:
                 parsed = self._parse_item(item)
                 if parsed:
                     items.append(parsed)
             except Exception:
                 logger.exception("Failed to parse GDACS item")
+            item.clear()
 
         return items
 
     def _parse_item(self, item: ET.Element) -> dict[str, Any] | None:
-        title = self._text(item, "title")
-        description = self._text(item, "description")
-        link = self._text(item, "link")
-        pub_date = self._text(item, "pubDate")
+        # One pass over the children instead of a find() per field; the first
+        # occurrence of a tag wins, as it did with find()
+        fields: dict[Any, str | None] = {}
+        for child in item:
+            if child.tag not in fields:
+                fields[child.tag] = child.text.strip() if child.text else None
+
+        title = fields.get("title")
+        description = fields.get("description")
+        link = fields.get("link")
+        pub_date = fields.get("pubDate")
 
         # GDACS-specific fields
-        event_type = self._text(item, "gdacs:eventtype", GDACS_NS)
-        alert_level = self._text(item, "gdacs:alertlevel", GDACS_NS)
-        event_id = self._text(item, "gdacs:eventid", GDACS_NS)
-        severity_value = self._text(item, "gdacs:severity", GDACS_NS)
-        population = self._text(item, "gdacs:population", GDACS_NS)
+        event_type = fields.get(_TAG_EVENTTYPE)
+        alert_level = fields.get(_TAG_ALERTLEVEL)
+        event_id = fields.get(_TAG_EVENTID)
+        severity_value = fields.get(_TAG_SEVERITY)
+        population = fields.get(_TAG_POPULATION)
 
-        lat_text = self._text(item, "geo:lat", GDACS_NS)
-        lon_text = self._text(item, "geo:long", GDACS_NS)
+        lat_text = fields.get(_TAG_LAT)
+        lon_text = fields.get(_TAG_LONG)
 
         lat = float(lat_text) if lat_text else None
         lon = float(lon_text) if lon_text else None
@@ -143,25 +188,26 @@ class GDACSService:
         }
 
     async def _deduplicate_and_store(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Insert only events whose external_id is not already present (in-memory)."""
+        """Insert-or-ignore on external_id in the in-memory store."""
         if not items:
             return []
 
-        source_id = memory_store.get_source_id("gdacs")
-
-        rows = []
-        for item in items:
-            ext_id = item.get("external_id")
-            if ext_id and memory_store.event_exists(ext_id):
-                continue
-            rows.append(
-                {
-                    "id": str(uuid4()),
-                    "source_id": source_id,
-                    **item,
-                    "ingested_at": datetime.now(UTC).isoformat(),
-                }
-            )
+        if self._source_id is None:
+            self._source_id = memory_store.get_source_id("gdacs")
+        source_id = self._source_id
+
+        # add_ingested_events skips already-seen external_ids under its lock,
+        # so no separate existence check is needed
+        ingested_at = datetime.now(UTC).isoformat()
+        rows = [
+            {
+                "id": row_id,
+                "source_id": source_id,
+                **item,
+                "ingested_at": ingested_at,
+            }
+            for row_id, item in zip(uuid4_batch(len(items)), items)
+        ]
 
         return memory_store.add_ingested_events(rows)
 
@@ -182,10 +228,3 @@ class GDACSService:
             "latitude": event.get("latitude"),
             "longitude": event.get("longitude"),
         }
-
-    # ── helpers ─────────────────────────────────────────────────────
-
-    @staticmethod
-    def _text(el: ET.Element, tag: str, ns: dict[str, str] | None = None) -> str | None:
-        child = el.find(tag, ns) if ns else el.find(tag)
-        return child.text.strip() if child is not None and child.text else None
@@ -14,15 +14,21 @@ Oldest entries are evicted when the limit is reached.
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
 import threading
 from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from operator import itemgetter
 from typing import Any
 
 _MAX_EVENTS = 2000
 _MAX_WEATHER = 500
 _MAX_SATELLITE = 2000
 _MAX_ALERTS = 500
+_MAX_SEEN_IDS = 100_000
 
 _lock = threading.Lock()
 
@@ -34,9 +40,20 @@ _satellite_observations: OrderedDict[str, dict[str, Any]] = OrderedDict()
 _alert_notifications: OrderedDict[str, dict[str, Any]] = OrderedDict()
 _external_data_sources: dict[str, dict[str, Any]] = {}
 
-# Dedup sets (external_id values already seen)
-_seen_event_ids: set[str] = set()
-_seen_satellite_ids: set[str] = set()
+# Dedup sets (external_id values already seen), kept as bounded LRUs so ids
+# that feeds keep re-reporting stay resident while stale ones age out
+_seen_event_ids: OrderedDict[str, None] = OrderedDict()
+_seen_satellite_ids: OrderedDict[str, None] = OrderedDict()
+
+# Coarse lat/lon grid over satellite observations so area queries only
+# visit nearby cells: (lat_cell, lon_cell) -> {id: (seq, row)} in insert order
+_SATELLITE_CELL_DEG = 1.0
+_satellite_cells: dict[tuple[int, int], dict[str, tuple[int, dict[str, Any]]]] = {}
+_satellite_seq = itertools.count()
+
+# Newest weather observation per location_id, kept alongside
+# _weather_observations so prediction feature lookups are O(1)
+_latest_weather_by_location: dict[str, dict[str, Any]] = {}
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
@@ -47,6 +64,17 @@ def _trim(store: OrderedDict, max_size: int) -> None:
         store.popitem(last=False)
 
 
+def _seen_before(seen: OrderedDict[str, None], ext_id: str) -> bool:
+    """Check-and-record *ext_id* in an LRU seen-set; True if it was already there."""
+    if ext_id in seen:
+        seen.move_to_end(ext_id)
+        return True
+    seen[ext_id] = None
+    if len(seen) > _MAX_SEEN_IDS:
+        seen.popitem(last=False)
+    return False
+
+
 def _match(row: dict[str, Any], filters: dict[str, Any]) -> bool:
     for key, val in filters.items():
         if val is None:
@@ -65,18 +93,18 @@ def add_ingested_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
         for e in events:
             eid = e.get("id", "")
             ext_id = e.get("external_id")
-            if ext_id and ext_id in _seen_event_ids:
+            if ext_id and _seen_before(_seen_event_ids, ext_id):
                 continue
             _ingested_events[eid] = e
-            if ext_id:
-                _seen_event_ids.add(ext_id)
             added.append(e)
         _trim(_ingested_events, _MAX_EVENTS)
     return added
 
 
-def event_exists(external_id: str) -> bool:
-    return external_id in _seen_event_ids
+def unseen_event_ids(external_ids: list[str]) -> set[str]:
+    """Return the subset of *external_ids* not ingested yet, without recording them."""
+    with _lock:
+        return {e for e in external_ids if e not in _seen_event_ids}
 
 
 def query_ingested_events(
@@ -118,7 +146,14 @@ def add_weather_observations(observations: list[dict[str, Any]]) -> None:
     with _lock:
         for o in observations:
             _weather_observations[o.get("id", "")] = o
-        _trim(_weather_observations, _MAX_WEATHER)
+            if o.get("location_id"):
+                _latest_weather_by_location[o["location_id"]] = o
+        while len(_weather_observations) > _MAX_WEATHER:
+            _, old = _weather_observations.popitem(last=False)
+            # Rows arrive in time order, so an evicted row that is still a
+            # location's latest means that location has no rows left
+            if _latest_weather_by_location.get(old.get("location_id")) is old:
+                del _latest_weather_by_location[old["location_id"]]
 
 
 def query_weather(*, location_id: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
@@ -130,28 +165,64 @@ def query_weather(*, location_id: str | None = None, limit: int = 50) -> list[di
 
 
 def latest_weather_for_location(location_id: str) -> dict[str, Any] | None:
-    rows = query_weather(location_id=location_id, limit=1)
-    return rows[0] if rows else None
+    return _latest_weather_by_location.get(location_id)
 
 
 # ── Satellite Observations ──────────────────────────────────────────
 
 
+def _satellite_cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / _SATELLITE_CELL_DEG), math.floor(lon / _SATELLITE_CELL_DEG)
+
+
+def _unindex_satellite(obs_id: str, row: dict[str, Any]) -> None:
+    key = _satellite_cell(row.get("latitude", 0), row.get("longitude", 0))
+    cell = _satellite_cells.get(key)
+    if cell is not None:
+        cell.pop(obs_id, None)
+        if not cell:
+            del _satellite_cells[key]
+
+
+def _iter_satellites_in_box(lat_range: tuple[float, float], lon_range: tuple[float, float]) -> Iterator[dict[str, Any]]:
+    """Newest-first candidates from the grid cells overlapping the box (caller holds the lock)."""
+    lat_lo, lon_lo = _satellite_cell(lat_range[0], lon_range[0])
+    lat_hi, lon_hi = _satellite_cell(lat_range[1], lon_range[1])
+    if (lat_hi - lat_lo + 1) * (lon_hi - lon_lo + 1) <= len(_satellite_cells):
+        keys = itertools.product(range(lat_lo, lat_hi + 1), range(lon_lo, lon_hi + 1))
+        cells = [_satellite_cells[k] for k in keys if k in _satellite_cells]
+    else:
+        cells = [c for (la, lo), c in _satellite_cells.items() if lat_lo <= la <= lat_hi and lon_lo <= lo <= lon_hi]
+    merged = heapq.merge(*(reversed(c.values()) for c in cells), key=itemgetter(0), reverse=True)
+    return map(itemgetter(1), merged)
+
+
 def add_satellite_observations(observations: list[dict[str, Any]]) -> list[dict[str, Any]]:
     with _lock:
         added = []
         for o in observations:
             ext_id = o.get("external_id", "")
-            if ext_id and ext_id in _seen_satellite_ids:
+            if ext_id and _seen_before(_seen_satellite_ids, ext_id):
                 continue
-            _satellite_observations[o.get("id", "")] = o
-            if ext_id:
-                _seen_satellite_ids.add(ext_id)
+            obs_id = o.get("id", "")
+            previous = _satellite_observations.get(obs_id)
+            if previous is not None:
+                _unindex_satellite(obs_id, previous)
+            _satellite_observations[obs_id] = o
+            key = _satellite_cell(o.get("latitude", 0), o.get("longitude", 0))
+            _satellite_cells.setdefault(key, {})[obs_id] = (next(_satellite_seq), o)
             added.append(o)
-        _trim(_satellite_observations, _MAX_SATELLITE)
+        while len(_satellite_observations) > _MAX_SATELLITE:
+            _unindex_satellite(*_satellite_observations.popitem(last=False))
     return added
 
 
+def unseen_satellite_ids(external_ids: list[str]) -> set[str]:
+    """Return the subset of *external_ids* not stored yet, without recording them."""
+    with _lock:
+        return {e for e in external_ids if e not in _seen_satellite_ids}
+
+
 def query_satellites(
     *,
     disaster_id: str | None = None,
@@ -161,7 +232,10 @@ def query_satellites(
     limit: int = 50,
 ) -> list[dict[str, Any]]:
     with _lock:
-        results = list(reversed(_satellite_observations.values()))
+        if lat_range and lon_range:
+            results = list(_iter_satellites_in_box(lat_range, lon_range))
+        else:
+            results = list(reversed(_satellite_observations.values()))
     filtered = []
     for r in results:
         if disaster_id and r.get("disaster_id") != disaster_id:
@@ -182,12 +256,45 @@ def query_satellites(
     return filtered
 
 
+def summarize_satellites(
+    lat_range: tuple[float, float],
+    lon_range: tuple[float, float],
+    *,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """Count / mean FRP / max brightness / latest over the newest *limit* observations in the box, in one pass."""
+    count = 0
+    frp_total = 0.0
+    max_brightness = 0
+    latest = None
+    with _lock:
+        for r in _iter_satellites_in_box(lat_range, lon_range):
+            lat = r.get("latitude", 0)
+            lon = r.get("longitude", 0)
+            if lat < lat_range[0] or lat > lat_range[1] or lon < lon_range[0] or lon > lon_range[1]:
+                continue
+            if latest is None:
+                latest = r
+            frp_total += r.get("frp", 0) or 0
+            max_brightness = max(max_brightness, r.get("brightness", 0) or 0)
+            count += 1
+            if count >= limit:
+                break
+    return {
+        "hotspot_count": count,
+        "avg_frp": frp_total / count if count else 0,
+        "max_brightness": max_brightness,
+        "latest": latest,
+    }
+
+
 # ── Alert Notifications ─────────────────────────────────────────────
 
 
-def add_alert_notification(notif: dict[str, Any]) -> None:
+def add_alert_notifications(notifs: list[dict[str, Any]]) -> None:
     with _lock:
-        _alert_notifications[notif.get("id", "")] = notif
+        for n in notifs:
+            _alert_notifications[n.get("id", "")] = n
         _trim(_alert_notifications, _MAX_ALERTS)
 
 
@@ -11,14 +11,24 @@ so the orchestrator processes them identically.
 
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import random
+import re
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
-from uuid import uuid4
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from app.core.helpers import uuid4_batch
 
 logger = logging.getLogger("ingestion.mock")
 
+# Batched generator for the numeric fields; one call fills a whole column
+_rng = np.random.default_rng()
+
 # ────────────────────────────────────────────────────────────────
 # 1. REAL-WORLD DISASTER-PRONE REGIONS
 # ────────────────────────────────────────────────────────────────
@@ -59,6 +69,22 @@ DISASTER_REGIONS: list[tuple[str, float, float, str, list[str]]] = [
     ("Cape Town, South Africa", -33.9249, 18.4241, "South Africa", ["drought", "wildfire"]),
 ]
 
+# Regions grouped by disaster type, built once instead of filtered per call
+_REGIONS_BY_TYPE: dict[str, list[tuple[str, float, float, str, list[str]]]] = {}
+for _region in DISASTER_REGIONS:
+    for _dtype in _region[4]:
+        _REGIONS_BY_TYPE.setdefault(_dtype, []).append(_region)
+del _region, _dtype
+
+# Column (SoA) views of DISASTER_REGIONS for batched region sampling:
+# draw an index array once, then gather names/coordinates by index
+_REGION_NAMES = [r[0] for r in DISASTER_REGIONS]
+_REGION_LAT = np.array([r[1] for r in DISASTER_REGIONS])
+_REGION_LON = np.array([r[2] for r in DISASTER_REGIONS])
+_REGION_IDX_BY_TYPE: dict[str, np.ndarray] = {
+    dtype: np.flatnonzero([dtype in r[4] for r in DISASTER_REGIONS]) for dtype in _REGIONS_BY_TYPE
+}
+
 # Severity distribution weights (realistic: most disasters are low-medium)
 SEVERITY_WEIGHTS = {
     "low": 0.30,
@@ -83,6 +109,15 @@ _WEATHER_CONDITIONS = [
     ("Mist", "mist"),
 ]
 
+# Precipitation range (mm) drawn for each condition above; dry conditions get (0, 0)
+_PRECIP_BY_MAIN = {
+    "Rain": (1.0, 25.0),
+    "Thunderstorm": (1.0, 25.0),
+    "Snow": (0.5, 8.0),
+    "Drizzle": (0.1, 2.0),
+}
+_PRECIP_LOW, _PRECIP_HIGH = np.array([_PRECIP_BY_MAIN.get(main, (0.0, 0.0)) for main, _ in _WEATHER_CONDITIONS]).T
+
 
 def generate_mock_weather(locations: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
     """
@@ -93,46 +128,68 @@ def generate_mock_weather(locations: list[dict[str, Any]] | None = None) -> list
         # Pick 3-6 random disaster regions as locations
         count = random.randint(3, 6)
         sample = random.sample(DISASTER_REGIONS, min(count, len(DISASTER_REGIONS)))
-        locations = [{"id": str(uuid4()), "name": r[0], "latitude": r[1], "longitude": r[2]} for r in sample]
+        locations = [
+            {"id": loc_id, "name": r[0], "latitude": r[1], "longitude": r[2]}
+            for loc_id, r in zip(uuid4_batch(len(sample)), sample)
+        ]
 
-    observations = []
+    n = len(locations)
     now = datetime.now(UTC)
+    observed_at = now.isoformat()
+
+    # Read each location's fields once; callers may omit keys, so defaults apply
+    loc_fields = [
+        (loc.get("id"), loc.get("latitude", 0), loc.get("longitude", 0), loc.get("name", "Unknown"))
+        for loc in locations
+    ]
+
+    # Draw every numeric field for the whole batch at once
+    lats = np.array([f[1] for f in loc_fields], dtype=np.float64)
+    # Temperature based roughly on latitude (tropical = warmer)
+    temps = np.round(30 - np.abs(lats) * 0.4 + _rng.uniform(-5, 5, n), 1)
+    humidity = _rng.integers(30, 96, n)
+    wind = np.round(_rng.uniform(0.5, 25.0, n), 1)
+    wind_deg = _rng.integers(0, 361, n)
+    pressure = _rng.integers(995, 1031, n)
+    visibility = _rng.integers(2000, 10001, n)
+    conditions = _rng.integers(0, len(_WEATHER_CONDITIONS), n)
+    # Precipitation only for rain/storm/snow/drizzle (zero-width range otherwise)
+    precip = np.round(_rng.uniform(_PRECIP_LOW[conditions], _PRECIP_HIGH[conditions]), 1)
 
-    for loc in locations:
-        lat = loc.get("latitude", 0)
-        # Temperature based roughly on latitude (tropical = warmer)
-        base_temp = 30 - abs(lat) * 0.4 + random.uniform(-5, 5)
-        condition = random.choice(_WEATHER_CONDITIONS)
-
-        # Increase precipitation for rain/storm
-        precip = 0.0
-        if "Rain" in condition[0] or "Thunderstorm" in condition[0]:
-            precip = random.uniform(1.0, 25.0)
-        elif "Snow" in condition[0]:
-            precip = random.uniform(0.5, 8.0)
-        elif "Drizzle" in condition[0]:
-            precip = random.uniform(0.1, 2.0)
-
+    observations = []
+    for obs_id, (loc_id, lat, lon, loc_name), temp, hum, ws, wd, pres, pr, vis, cond in zip(
+        uuid4_batch(n),
+        loc_fields,
+        temps.tolist(),
+        humidity.tolist(),
+        wind.tolist(),
+        wind_deg.tolist(),
+        pressure.tolist(),
+        precip.tolist(),
+        visibility.tolist(),
+        conditions.tolist(),
+    ):
+        weather_main, weather_desc = _WEATHER_CONDITIONS[cond]
         obs = {
-            "id": str(uuid4()),
-            "location_id": loc.get("id"),
+            "id": obs_id,
+            "location_id": loc_id,
             "latitude": lat,
-            "longitude": loc.get("longitude", 0),
-            "temperature_c": round(base_temp, 1),
-            "humidity_pct": random.randint(30, 95),
-            "wind_speed_ms": round(random.uniform(0.5, 25.0), 1),
-            "wind_deg": random.randint(0, 360),
-            "pressure_hpa": random.randint(995, 1030),
-            "precipitation_mm": round(precip, 1),
-            "visibility_m": random.randint(2000, 10000),
-            "weather_main": condition[0],
-            "weather_desc": condition[1],
-            "observed_at": now.isoformat(),
+            "longitude": lon,
+            "temperature_c": temp,
+            "humidity_pct": hum,
+            "wind_speed_ms": ws,
+            "wind_deg": wd,
+            "pressure_hpa": pres,
+            "precipitation_mm": pr,
+            "visibility_m": vis,
+            "weather_main": weather_main,
+            "weather_desc": weather_desc,
+            "observed_at": observed_at,
             "source": "mock_weather",
             "raw_payload": {
                 "mock": True,
                 "generator": "mock_data_service",
-                "location_name": loc.get("name", "Unknown"),
+                "location_name": loc_name,
             },
         }
         observations.append(obs)
@@ -145,6 +202,39 @@ def generate_mock_weather(locations: list[dict[str, Any]] | None = None) -> list
 # 3. EARTHQUAKE (USGS) MOCK GENERATOR
 # ────────────────────────────────────────────────────────────────
 
+# Magnitude → severity: a magnitude at or above _MAG_THRESHOLDS[i] gets _MAG_SEVERITIES[i + 1]
+_MAG_THRESHOLDS = np.array([5.0, 6.0, 7.0])
+_MAG_SEVERITIES = np.array(["low", "medium", "high", "critical"])
+
+# Key layout of each event and its raw_payload, with the constant fields
+# filled in; rows are copied from these and only the varying fields are set
+_EQ_EVENT_PROTO: dict[str, Any] = {
+    "external_id": None,
+    "event_type": "earthquake",
+    "title": None,
+    "description": None,
+    "severity": None,
+    "latitude": None,
+    "longitude": None,
+    "location_name": None,
+    "raw_payload": None,
+}
+_EQ_PAYLOAD_PROTO: dict[str, Any] = {
+    "usgs_id": None,
+    "magnitude": None,
+    "mag_type": "mww",
+    "depth_km": None,
+    "place": None,
+    "time": None,
+    "url": None,
+    "tsunami": 0,
+    "felt": 0,
+    "alert": None,
+    "status": "reviewed",
+    "type": "earthquake",
+    "mock": True,
+}
+
 
 def generate_mock_earthquakes(count: int | None = None) -> list[dict[str, Any]]:
     """
@@ -161,152 +251,191 @@ def generate_mock_earthquakes(count: int | None = None) -> list[dict[str, Any]]:
     if count == 0:
         return []
 
-    # Filter to earthquake-prone regions
-    eq_regions = [r for r in DISASTER_REGIONS if "earthquake" in r[4]]
     events = []
     now = datetime.now(UTC)
 
-    for _ in range(count):
-        region = random.choice(eq_regions)
-        # Add some jitter to coordinates (±0.5 degrees)
-        lat = region[1] + random.uniform(-0.5, 0.5)
-        lon = region[2] + random.uniform(-0.5, 0.5)
-
-        magnitude = round(random.uniform(4.0, 8.5), 1)
-        # Weight towards smaller earthquakes
-        magnitude = round(4.0 + abs(random.gauss(0, 1.2)), 1)
-        magnitude = min(magnitude, 9.0)
+    # Batch the region pick, the ±0.5 degree coordinate jitter and the
+    # magnitude draw (half-normal, weighted towards smaller earthquakes)
+    region_idx = _rng.choice(_REGION_IDX_BY_TYPE["earthquake"], count)
+    lats = np.round(_REGION_LAT[region_idx] + _rng.uniform(-0.5, 0.5, count), 4)
+    lons = np.round(_REGION_LON[region_idx] + _rng.uniform(-0.5, 0.5, count), 4)
+    magnitudes = np.minimum(np.round(4.0 + np.abs(_rng.standard_normal(count)) * 1.2, 1), 9.0)
+    severities = _MAG_SEVERITIES[np.searchsorted(_MAG_THRESHOLDS, magnitudes, side="right")]
+    # One entropy draw for every event's 10-hex-digit id
+    id_hex = os.urandom(5 * count).hex()
+    payload_proto = {**_EQ_PAYLOAD_PROTO, "time": int(now.timestamp() * 1000)}
+
+    for i, idx, lat, lon, magnitude, severity in zip(
+        range(0, 10 * count, 10),
+        region_idx.tolist(),
+        lats.tolist(),
+        lons.tolist(),
+        magnitudes.tolist(),
+        severities.tolist(),
+    ):
         depth_km = round(random.uniform(5, 300), 1)
 
-        severity = _magnitude_to_severity(magnitude)
-        place = f"{random.randint(5, 200)}km {'NSEW'[random.randint(0, 3)]} of {region[0]}"
-        usgs_id = f"mock{uuid4().hex[:10]}"
-
-        events.append(
-            {
-                "external_id": f"usgs-{usgs_id}",
-                "event_type": "earthquake",
-                "title": f"M{magnitude} - {place}",
-                "description": f"M{magnitude} earthquake at {place}. Depth: {depth_km} km.",
-                "severity": severity,
-                "latitude": round(lat, 4),
-                "longitude": round(lon, 4),
-                "location_name": place,
-                "raw_payload": {
-                    "usgs_id": usgs_id,
-                    "magnitude": magnitude,
-                    "mag_type": "mww",
-                    "depth_km": depth_km,
-                    "place": place,
-                    "time": int(now.timestamp() * 1000),
-                    "url": f"https://earthquake.usgs.gov/earthquakes/eventpage/{usgs_id}",
-                    "tsunami": 1 if magnitude >= 7.0 else 0,
-                    "felt": random.randint(0, 500) if magnitude >= 5.0 else 0,
-                    "alert": severity if magnitude >= 5.5 else None,
-                    "status": "reviewed",
-                    "type": "earthquake",
-                    "mock": True,
-                },
-            }
-        )
+        place = f"{random.randint(5, 200)}km {'NSEW'[random.randint(0, 3)]} of {_REGION_NAMES[idx]}"
+        usgs_id = f"mock{id_hex[i : i + 10]}"
+
+        payload = payload_proto.copy()
+        payload["usgs_id"] = usgs_id
+        payload["magnitude"] = magnitude
+        payload["depth_km"] = depth_km
+        payload["place"] = place
+        payload["url"] = f"https://earthquake.usgs.gov/earthquakes/eventpage/{usgs_id}"
+        if magnitude >= 5.0:
+            payload["felt"] = random.randint(0, 500)
+            if magnitude >= 5.5:
+                payload["alert"] = severity
+                if magnitude >= 7.0:
+                    payload["tsunami"] = 1
+
+        event = _EQ_EVENT_PROTO.copy()
+        event["external_id"] = f"usgs-{usgs_id}"
+        event["title"] = f"M{magnitude} - {place}"
+        event["description"] = f"M{magnitude} earthquake at {place}. Depth: {depth_km} km."
+        event["severity"] = severity
+        event["latitude"] = lat
+        event["longitude"] = lon
+        event["location_name"] = place
+        event["raw_payload"] = payload
+        events.append(event)
 
     logger.info("Mock earthquakes generated: %d events", len(events))
     return events
 
 
-def _magnitude_to_severity(mag: float) -> str:
-    if mag >= 7.0:
-        return "critical"
-    elif mag >= 6.0:
-        return "high"
-    elif mag >= 5.0:
-        return "medium"
-    return "low"
-
-
 # ────────────────────────────────────────────────────────────────
 # 4. GDACS DISASTER MOCK GENERATOR
 # ────────────────────────────────────────────────────────────────
 
+_CYCLONE_NAMES = [
+    "Maria",
+    "Irma",
+    "Katrina",
+    "Harvey",
+    "Dorian",
+    "Haiyan",
+    "Amphan",
+    "Nargis",
+    "Sandy",
+    "Michael",
+    "Idai",
+    "Winston",
+]
+
+
+def _hurricane_params(n: int) -> list[dict[str, Any]]:
+    return [
+        {"name": name, "cat": cat, "wind": wind, "pop": pop}
+        for name, cat, wind, pop in zip(
+            _rng.choice(_CYCLONE_NAMES, n).tolist(),
+            _rng.integers(1, 6, n).tolist(),
+            _rng.integers(120, 301, n).tolist(),
+            _rng.integers(50000, 5000001, n).tolist(),
+        )
+    ]
+
+
+def _flood_params(n: int) -> list[dict[str, Any]]:
+    return [
+        {"level": level, "area": area, "pop": pop}
+        for level, area, pop in zip(
+            np.round(_rng.uniform(0.5, 8.0, n), 1).tolist(),
+            _rng.integers(50, 5001, n).tolist(),
+            _rng.integers(10000, 2000001, n).tolist(),
+        )
+    ]
+
+
+def _wildfire_params(n: int) -> list[dict[str, Any]]:
+    return [
+        {"area": area, "rate": rate, "wind": wind}
+        for area, rate, wind in zip(
+            _rng.integers(100, 50001, n).tolist(),
+            _rng.integers(5, 201, n).tolist(),
+            _rng.integers(10, 81, n).tolist(),
+        )
+    ]
+
+
+def _volcano_params(n: int) -> list[dict[str, Any]]:
+    return [
+        {"alert": alert, "ash": ash}
+        for alert, ash in zip(
+            _rng.choice(["Warning", "Watch", "Advisory"], n).tolist(),
+            np.round(_rng.uniform(1, 15, n), 1).tolist(),
+        )
+    ]
+
+
+def _drought_params(n: int) -> list[dict[str, Any]]:
+    return [
+        {"deficit": deficit, "months": months}
+        for deficit, months in zip(
+            _rng.integers(40, 91, n).tolist(),
+            _rng.integers(2, 19, n).tolist(),
+        )
+    ]
+
+
+class _Tpl(NamedTuple):
+    """A GDACS mock template; ``params(n)`` draws the format fields for n events."""
+
+    type: str
+    gdacs_type: str
+    title_tpl: str
+    desc_tpl: str
+    params: Callable[[int], list[dict[str, Any]]]
+
+
 _GDACS_DISASTER_TEMPLATES = [
-    {
-        "type": "hurricane",
-        "gdacs_type": "TC",
-        "title_tpl": "Tropical Cyclone {name} - Category {cat}",
-        "desc_tpl": "Tropical Cyclone {name} with sustained winds of {wind}km/h affecting {region}. "
+    _Tpl(
+        type="hurricane",
+        gdacs_type="TC",
+        title_tpl="Tropical Cyclone {name} - Category {cat}",
+        desc_tpl="Tropical Cyclone {name} with sustained winds of {wind}km/h affecting {region}. "
         "Category {cat} storm. Population exposed: ~{pop:,}.",
-        "params": lambda: {
-            "name": random.choice(
-                [
-                    "Maria",
-                    "Irma",
-                    "Katrina",
-                    "Harvey",
-                    "Dorian",
-                    "Haiyan",
-                    "Amphan",
-                    "Nargis",
-                    "Sandy",
-                    "Michael",
-                    "Idai",
-                    "Winston",
-                ]
-            ),
-            "cat": random.randint(1, 5),
-            "wind": random.randint(120, 300),
-            "pop": random.randint(50000, 5000000),
-        },
-    },
-    {
-        "type": "flood",
-        "gdacs_type": "FL",
-        "title_tpl": "Flood Alert - {region}",
-        "desc_tpl": "Severe flooding reported in {region}. Water level {level}m above normal. "
+        params=_hurricane_params,
+    ),
+    _Tpl(
+        type="flood",
+        gdacs_type="FL",
+        title_tpl="Flood Alert - {region}",
+        desc_tpl="Severe flooding reported in {region}. Water level {level}m above normal. "
         "Affected area: {area}km². Population exposed: ~{pop:,}.",
-        "params": lambda: {
-            "level": round(random.uniform(0.5, 8.0), 1),
-            "area": random.randint(50, 5000),
-            "pop": random.randint(10000, 2000000),
-        },
-    },
-    {
-        "type": "wildfire",
-        "gdacs_type": "WF",
-        "title_tpl": "Wildfire - {region}",
-        "desc_tpl": "Active wildfire detected near {region}. Burning area: {area}ha. "
+        params=_flood_params,
+    ),
+    _Tpl(
+        type="wildfire",
+        gdacs_type="WF",
+        title_tpl="Wildfire - {region}",
+        desc_tpl="Active wildfire detected near {region}. Burning area: {area}ha. "
         "Fire spread rate: {rate}ha/hr. Wind speed: {wind}km/h.",
-        "params": lambda: {
-            "area": random.randint(100, 50000),
-            "rate": random.randint(5, 200),
-            "wind": random.randint(10, 80),
-        },
-    },
-    {
-        "type": "volcano",
-        "gdacs_type": "VO",
-        "title_tpl": "Volcanic Activity - {region}",
-        "desc_tpl": "Increased volcanic activity detected at {region}. "
-        "Alert level: {alert}. Ash plume height: {ash}km.",
-        "params": lambda: {
-            "alert": random.choice(["Warning", "Watch", "Advisory"]),
-            "ash": round(random.uniform(1, 15), 1),
-        },
-    },
-    {
-        "type": "drought",
-        "gdacs_type": "DR",
-        "title_tpl": "Drought Alert - {region}",
-        "desc_tpl": "Severe drought conditions in {region}. "
+        params=_wildfire_params,
+    ),
+    _Tpl(
+        type="volcano",
+        gdacs_type="VO",
+        title_tpl="Volcanic Activity - {region}",
+        desc_tpl="Increased volcanic activity detected at {region}. Alert level: {alert}. Ash plume height: {ash}km.",
+        params=_volcano_params,
+    ),
+    _Tpl(
+        type="drought",
+        gdacs_type="DR",
+        title_tpl="Drought Alert - {region}",
+        desc_tpl="Severe drought conditions in {region}. "
         "Rainfall deficit: {deficit}% below average. Duration: {months} months.",
-        "params": lambda: {
-            "deficit": random.randint(40, 90),
-            "months": random.randint(2, 18),
-        },
-    },
+        params=_drought_params,
+    ),
 ]
 
 _ALERT_LEVELS = ["Green", "Orange", "Red"]
 _ALERT_WEIGHTS = [0.35, 0.40, 0.25]
+# Cumulative weights, so sampling is one bisect instead of a random.choices call
+_ALERT_CUM_WEIGHTS = list(itertools.accumulate(_ALERT_WEIGHTS))
 _SEVERITY_MAP = {"Red": "critical", "Orange": "high", "Green": "medium"}
 
 
@@ -326,33 +455,54 @@ def generate_mock_gdacs_events(count: int | None = None) -> list[dict[str, Any]]
 
     events = []
     now = datetime.now(UTC)
+    pub_date = now.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    # Batch every numeric draw for the call: template, jitter, alert level, event id
+    template_idx = _rng.integers(0, len(_GDACS_DISASTER_TEMPLATES), count)
+    jitter = _rng.uniform(-1.0, 1.0, (count, 2))
+    alert_idx = np.searchsorted(_ALERT_CUM_WEIGHTS, _rng.random(count) * _ALERT_CUM_WEIGHTS[-1], side="right")
+    event_ids = _rng.integers(1000000, 10000000, count)
+
+    # Draw each template's params and regions (ones appropriate for its
+    # disaster type) once for all events that use it
+    params_by_event: list[dict[str, Any]] = [{}] * count
+    region_by_event: list[tuple[str, float, float, str, list[str]]] = [DISASTER_REGIONS[0]] * count
+    for t, template in enumerate(_GDACS_DISASTER_TEMPLATES):
+        rows = np.flatnonzero(template_idx == t).tolist()
+        if rows:
+            matching_regions = _REGIONS_BY_TYPE.get(template.type) or DISASTER_REGIONS
+            for row, params, region in zip(
+                rows, template.params(len(rows)), random.choices(matching_regions, k=len(rows))
+            ):
+                params_by_event[row] = params
+                region_by_event[row] = region
+
+    for t, (dlat, dlon), a, eid, params, region in zip(
+        template_idx.tolist(),
+        jitter.tolist(),
+        alert_idx.tolist(),
+        event_ids.tolist(),
+        params_by_event,
+        region_by_event,
+    ):
+        template = _GDACS_DISASTER_TEMPLATES[t]
+        dtype = template.type
+
+        lat = region[1] + dlat
+        lon = region[2] + dlon
 
-    for _ in range(count):
-        template = random.choice(_GDACS_DISASTER_TEMPLATES)
-        dtype = template["type"]
-
-        # Pick a region appropriate for this disaster type
-        matching_regions = [r for r in DISASTER_REGIONS if dtype in r[4]]
-        if not matching_regions:
-            matching_regions = DISASTER_REGIONS
-        region = random.choice(matching_regions)
-
-        lat = region[1] + random.uniform(-1.0, 1.0)
-        lon = region[2] + random.uniform(-1.0, 1.0)
-
-        params = template["params"]()
         params["region"] = region[0]
 
-        alert_level = random.choices(_ALERT_LEVELS, weights=_ALERT_WEIGHTS, k=1)[0]
+        alert_level = _ALERT_LEVELS[a]
         severity = _SEVERITY_MAP[alert_level]
-        event_id = str(random.randint(1000000, 9999999))
+        event_id = str(eid)
 
-        title = template["title_tpl"].format(**params)
-        description = template["desc_tpl"].format(**params)
+        title = template.title_tpl.format_map(params)
+        description = template.desc_tpl.format_map(params)
 
         events.append(
             {
-                "external_id": f"gdacs-{template['gdacs_type']}-{event_id}",
+                "external_id": f"gdacs-{template.gdacs_type}-{event_id}",
                 "event_type": "gdacs_alert",
                 "title": title,
                 "description": description,
@@ -362,8 +512,8 @@ def generate_mock_gdacs_events(count: int | None = None) -> list[dict[str, Any]]
                 "location_name": region[0],
                 "raw_payload": {
                     "link": f"https://www.gdacs.org/report.aspx?eventid={event_id}",
-                    "pub_date": now.strftime("%a, %d %b %Y %H:%M:%S GMT"),
-                    "gdacs_event_type": template["gdacs_type"],
+                    "pub_date": pub_date,
+                    "gdacs_event_type": template.gdacs_type,
                     "gdacs_alert_level": alert_level,
                     "gdacs_event_id": event_id,
                     "gdacs_severity": str(params.get("cat", params.get("level", "N/A"))),
@@ -385,8 +535,8 @@ def generate_mock_gdacs_events(count: int | None = None) -> list[dict[str, Any]]
 
 def generate_mock_fire_hotspots(count: int | None = None) -> list[dict[str, Any]]:
     """
-    Generate realistic satellite fire hotspot observations in the
-    same format as FIRMSService._parse_csv() output.
+    Generate realistic satellite fire hotspot observations with the
+    same fields as the FirmsRow rows FIRMSService._parse_csv() returns.
     """
     if count is None:
         if random.random() < 0.4:
@@ -397,12 +547,17 @@ def generate_mock_fire_hotspots(count: int | None = None) -> list[dict[str, Any]
     if count == 0:
         return []
 
-    fire_regions = [r for r in DISASTER_REGIONS if "wildfire" in r[4]]
+    fire_regions = _REGIONS_BY_TYPE["wildfire"]
     observations = []
     now = datetime.now(UTC)
-
-    for _ in range(count):
-        region = random.choice(fire_regions)
+    # Every hotspot in a batch shares the same acquisition instant
+    acq_date = now.strftime("%Y-%m-%d")
+    acq_time = f"{now.hour:02d}{now.minute:02d}"
+    acq_datetime = now.isoformat()
+    # Row ids and the 6-hex-digit external_id suffixes are drawn once per batch
+    suffix_hex = os.urandom(3 * count).hex()
+
+    for obs_id, i, region in zip(uuid4_batch(count), range(0, 6 * count, 6), random.choices(fire_regions, k=count)):
         # Cluster hotspots around the region (±0.3 degrees)
         lat = region[1] + random.uniform(-0.3, 0.3)
         lon = region[2] + random.uniform(-0.3, 0.3)
@@ -411,14 +566,12 @@ def generate_mock_fire_hotspots(count: int | None = None) -> list[dict[str, Any]
         frp = round(random.uniform(5, 200), 1)
         confidence = random.choice(["low", "nominal", "high"])
         satellite = random.choice(["N20", "NOAA-20", "Suomi NPP"])
-        acq_date = now.strftime("%Y-%m-%d")
-        acq_time = f"{now.hour:02d}{now.minute:02d}"
 
         observations.append(
             {
-                "id": str(uuid4()),
+                "id": obs_id,
                 "source": "mock_firms",
-                "external_id": f"firms-{lat:.4f}-{lon:.4f}-{acq_date}-{acq_time}-{uuid4().hex[:6]}",
+                "external_id": f"firms-{lat:.4f}-{lon:.4f}-{acq_date}-{acq_time}-{suffix_hex[i : i + 6]}",
                 "latitude": round(lat, 4),
                 "longitude": round(lon, 4),
                 "brightness": brightness,
@@ -426,7 +579,7 @@ def generate_mock_fire_hotspots(count: int | None = None) -> list[dict[str, Any]
                 "confidence": confidence,
                 "satellite": satellite,
                 "instrument": "VIIRS",
-                "acq_datetime": now.isoformat(),
+                "acq_datetime": acq_datetime,
                 "daynight": random.choice(["D", "N"]),
                 "raw_payload": {
                     "mock": True,
@@ -474,12 +627,12 @@ def generate_mock_social_signals(count: int | None = None) -> list[dict[str, Any
         return []
 
     events = []
-    now = datetime.now(UTC)
-
-    for _ in range(count):
-        region = random.choice(DISASTER_REGIONS)
-        template = random.choice(_SOCIAL_SOS_TEMPLATES)
+    created_at = datetime.now(UTC).isoformat()
 
+    for region, template in zip(
+        random.choices(DISASTER_REGIONS, k=count),
+        random.choices(_SOCIAL_SOS_TEMPLATES, k=count),
+    ):
         params = {
             "region": region[0],
             "cat": random.randint(1, 5),
@@ -487,13 +640,13 @@ def generate_mock_social_signals(count: int | None = None) -> list[dict[str, Any
             "days": random.randint(1, 7),
             "mag": round(random.uniform(4.0, 6.5), 1),
         }
-        text = template.format(**params)
+        text = template.format_map(params)
         tweet_id = str(random.randint(10**17, 10**18))
 
         lat = region[1] + random.uniform(-0.2, 0.2)
         lon = region[2] + random.uniform(-0.2, 0.2)
 
-        severity = _estimate_social_severity(text)
+        severity = _SOCIAL_SEVERITY[template, region[0]]
 
         events.append(
             {
@@ -508,7 +661,7 @@ def generate_mock_social_signals(count: int | None = None) -> list[dict[str, Any
                 "raw_payload": {
                     "tweet_id": tweet_id,
                     "author_id": str(random.randint(10**8, 10**9)),
-                    "created_at": now.isoformat(),
+                    "created_at": created_at,
                     "text": text,
                     "public_metrics": {
                         "retweet_count": random.randint(0, 5000),
@@ -524,12 +677,16 @@ def generate_mock_social_signals(count: int | None = None) -> list[dict[str, Any
     return events
 
 
+_CRITICAL_WORDS = frozenset({"trapped", "dying", "urgent", "critical", "sos", "life threatening"})
+_HIGH_WORDS = frozenset({"help needed", "rescue", "emergency", "injured", "flood", "earthquake"})
+# One scan finds every keyword; substring matching as before ("flooding" counts as "flood")
+_SEVERITY_WORDS_RE = re.compile("|".join(map(re.escape, sorted(_CRITICAL_WORDS | _HIGH_WORDS))))
+
+
 def _estimate_social_severity(text: str) -> str:
-    text_lower = text.lower()
-    critical_words = ["trapped", "dying", "urgent", "critical", "sos", "life threatening"]
-    high_words = ["help needed", "rescue", "emergency", "injured", "flood", "earthquake"]
-    c = sum(1 for w in critical_words if w in text_lower)
-    h = sum(1 for w in high_words if w in text_lower)
+    found = set(_SEVERITY_WORDS_RE.findall(text.lower()))
+    c = len(found & _CRITICAL_WORDS)
+    h = len(found & _HIGH_WORDS)
     if c >= 2:
         return "critical"
     if c >= 1 or h >= 2:
@@ -537,3 +694,12 @@ def _estimate_social_severity(text: str) -> str:
     if h >= 1:
         return "medium"
     return "low"
+
+
+# Keywords are letters only, so the numeric template params never change the
+# score: rate every (template, region) pair once here instead of per tweet
+_SOCIAL_SEVERITY: dict[tuple[str, str], str] = {
+    (template, region[0]): _estimate_social_severity(template.format(region=region[0], cat=0, fam=0, days=0, mag=0))
+    for template in _SOCIAL_SOS_TEMPLATES
+    for region in DISASTER_REGIONS
+}
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
@@ -26,6 +27,21 @@ from app.services.ingestion.weather_service import WeatherService
 
 logger = logging.getLogger("ingestion.orchestrator")
 
+# Consecutive empty polls before a feed loop starts backing off
+_IDLE_POLLS_BEFORE_BACKOFF = 3
+
+# An idle feed never waits longer than this multiple of its own interval
+_MAX_BACKOFF_FACTOR = 4
+
+# Feed loop name → source_name in the data-source store
+_SOURCE_NAMES: dict[str, str] = {
+    "weather": "openweathermap",
+    "gdacs": "gdacs",
+    "usgs": "usgs_earthquakes",
+    "firms": "nasa_firms",
+    "social": "social_media",
+}
+
 
 class IngestionOrchestrator:
     """
@@ -44,6 +60,7 @@ class IngestionOrchestrator:
         self._tasks: list[asyncio.Task] = []
         self._running = False
         self._ml_service = None  # set after startup via set_ml_service()
+        self._event_sem = asyncio.Semaphore(cfg.EVENT_CONCURRENCY)
 
     # ── lifecycle ───────────────────────────────────────────────────
 
@@ -85,54 +102,95 @@ class IngestionOrchestrator:
 
     # ── generic loop wrapper ────────────────────────────────────────
 
-    async def _loop(self, name: str, poll_fn, interval_s: int) -> None:
-        """Run *poll_fn* every *interval_s* seconds until cancelled."""
+    async def _loop(self, name: str, poll_fn: Callable[[], Awaitable[int]], interval_s: int) -> None:
+        """
+        Run *poll_fn* every *interval_s* seconds until cancelled.
+
+        *poll_fn* returns how many new items it ingested.  After
+        _IDLE_POLLS_BEFORE_BACKOFF empty polls in a row the interval doubles
+        per further empty poll, capped at _MAX_BACKOFF_FACTOR times the
+        interval or MAX_POLL_INTERVAL_S, whichever is lower, and snaps back
+        as soon as a poll brings something new.
+        """
+        if interval_s < cfg.MIN_POLL_INTERVAL_S:
+            logger.warning(
+                "Feed loop [%s] interval %ds is below MIN_POLL_INTERVAL_S – using %ds",
+                name,
+                interval_s,
+                cfg.MIN_POLL_INTERVAL_S,
+            )
+            interval_s = cfg.MIN_POLL_INTERVAL_S
+        max_interval_s = max(interval_s, min(interval_s * _MAX_BACKOFF_FACTOR, cfg.MAX_POLL_INTERVAL_S))
+        empty_streak = 0
         # Delay initial poll to let uvicorn finish binding to the port
         await asyncio.sleep(5)
         logger.info("Feed loop [%s] started – interval %ds", name, interval_s)
         while self._running:
             try:
-                await poll_fn()
+                new_items = await poll_fn()
                 await self._update_source_status(name, "success")
+                empty_streak = 0 if new_items else empty_streak + 1
             except asyncio.CancelledError:
                 break
             except Exception as exc:
                 logger.exception("Feed loop [%s] error", name)
                 await self._update_source_status(name, "error", str(exc))
-            await asyncio.sleep(interval_s)
+            backoff = max(0, empty_streak - _IDLE_POLLS_BEFORE_BACKOFF + 1)
+            await asyncio.sleep(min(interval_s * 2**backoff, max_interval_s))
 
     # ── individual poll handlers ────────────────────────────────────
 
-    async def _poll_weather(self) -> None:
+    async def _poll_weather(self) -> int:
         observations = await self.weather.poll()
         # Weather observations enrich prediction features rather than
         # creating new disaster events.  No auto-prediction triggered.
         logger.debug("Weather: %d observations", len(observations))
+        return len(observations)
 
-    async def _poll_gdacs(self) -> None:
+    async def _poll_gdacs(self) -> int:
         events = await self.gdacs.poll()
-        for event in events:
-            await self._process_disaster_event(event, "gdacs")
+        await self._process_events(events, lambda event: self._process_disaster_event(event, "gdacs"))
+        return len(events)
 
-    async def _poll_usgs(self) -> None:
+    async def _poll_usgs(self) -> int:
         events = await self.usgs.poll()
-        for event in events:
-            await self._process_disaster_event(event, "usgs")
+        await self._process_events(events, lambda event: self._process_disaster_event(event, "usgs"))
+        return len(events)
 
-    async def _poll_firms(self) -> None:
-        await self.firms.poll()
+    async def _poll_firms(self) -> int:
+        hotspots = await self.firms.poll()
         # Satellite hotspots are consumed directly by the spread predictor;
         # no individual disaster events are created per hotspot row.
+        return len(hotspots)
 
-    async def _poll_social(self) -> None:
+    async def _poll_social(self) -> int:
         """Poll social media — uses mock data when no API token is set."""
         events = await self.social.poll()
-        for event in events:
-            # Social signals with critical/high severity trigger disaster pipeline
-            if event.get("severity") in ("critical", "high"):
-                await self._process_disaster_event(event, "social")
-            else:
-                await self.alerts.evaluate_and_notify(event)
+        await self._process_events(events, self._process_social_event)
+        return len(events)
+
+    async def _process_social_event(self, event: dict[str, Any]) -> None:
+        # Social signals with critical/high severity trigger disaster pipeline
+        if event.get("severity") in ("critical", "high"):
+            await self._process_disaster_event(event, "social")
+        else:
+            await self.alerts.evaluate_and_notify(event)
+
+    async def _process_events(
+        self,
+        events: list[dict[str, Any]],
+        handler: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Run *handler* over independent events concurrently, bounded by EVENT_CONCURRENCY."""
+
+        async def guarded(event: dict[str, Any]) -> None:
+            async with self._event_sem:
+                await handler(event)
+
+        results = await asyncio.gather(*(guarded(event) for event in events), return_exceptions=True)
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to process event %s", event.get("external_id"), exc_info=result)
 
     # ── event → disaster → predictions pipeline ────────────────────
 
@@ -377,14 +435,7 @@ class IngestionOrchestrator:
 
     async def _update_source_status(self, source_name_key: str, status: str, error: str | None = None) -> None:
         """Update last_polled_at and last_status in in-memory source store."""
-        name_map = {
-            "weather": "openweathermap",
-            "gdacs": "gdacs",
-            "usgs": "usgs_earthquakes",
-            "firms": "nasa_firms",
-            "social": "social_media",
-        }
-        source_name = name_map.get(source_name_key, source_name_key)
+        source_name = _SOURCE_NAMES.get(source_name_key, source_name_key)
         memory_store.update_source_status(source_name, status, error)
 
     # ── manual trigger (used by API router) ─────────────────────────
@@ -11,18 +11,25 @@ The rest of the platform works fully without this service.
 from __future__ import annotations
 
 import logging
+import re
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
-
-import httpx
 
 from app.core.config import ingestion_config as cfg
+from app.core.helpers import uuid4_batch
+from app.core.http import get_client
 from app.services.ingestion import memory_store
 from app.services.ingestion.mock_data_service import generate_mock_social_signals
 
 logger = logging.getLogger("ingestion.social")
 
+_CRITICAL_WORDS = frozenset({"trapped", "dying", "urgent", "critical", "sos", "life threatening"})
+_HIGH_WORDS = frozenset({"help needed", "rescue", "emergency", "injured", "flood", "earthquake"})
+# Single scan for every keyword.  The lookahead reports a match at each
+# position, so overlapping keywords are all found – same result as testing
+# each word with `in`, including substrings ("flooding" counts as "flood").
+_SEVERITY_WORDS_RE = re.compile(f"(?=({'|'.join(map(re.escape, sorted(_CRITICAL_WORDS | _HIGH_WORDS)))}))")
+
 
 class SocialMediaService:
     """Polls Twitter/X v2 Recent Search for disaster-related keywords."""
@@ -31,6 +38,7 @@ class SocialMediaService:
         self.bearer_token = cfg.TWITTER_BEARER_TOKEN
         self.keywords = cfg.SOCIAL_KEYWORDS
         self._last_since_id: str | None = None
+        self._source_id: str | None = None
 
     async def poll(self) -> list[dict[str, Any]]:
         """Search for recent tweets matching disaster keywords.
@@ -74,12 +82,12 @@ class SocialMediaService:
 
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            resp = await client.get(url, headers=headers, params=params)
-            if resp.status_code == 429:
-                logger.warning("Twitter rate limit hit – will retry next cycle")
-                return []
-            resp.raise_for_status()
+        # Shared pooled client: the connection to api.twitter.com stays warm between polls
+        resp = await get_client().get(url, headers=headers, params=params, timeout=20)
+        if resp.status_code == 429:
+            logger.warning("Twitter rate limit hit – will retry next cycle")
+            return []
+        resp.raise_for_status()
 
         data = resp.json()
         tweets = data.get("data", [])
@@ -154,12 +162,9 @@ class SocialMediaService:
     @staticmethod
     def _estimate_severity(text: str) -> str:
         """Heuristic severity from tweet text."""
-        text_lower = text.lower()
-        critical_words = ["trapped", "dying", "urgent", "critical", "sos", "life threatening"]
-        high_words = ["help needed", "rescue", "emergency", "injured", "flood", "earthquake"]
-
-        critical_score = sum(1 for w in critical_words if w in text_lower)
-        high_score = sum(1 for w in high_words if w in text_lower)
+        found = set(_SEVERITY_WORDS_RE.findall(text.lower()))
+        critical_score = len(found & _CRITICAL_WORDS)
+        high_score = len(found & _HIGH_WORDS)
 
         if critical_score >= 2:
             return "critical"
@@ -173,20 +178,24 @@ class SocialMediaService:
         if not items:
             return []
 
-        source_id = memory_store.get_source_id("social_media")
-
-        rows = []
-        for item in items:
-            ext_id = item.get("external_id")
-            if ext_id and memory_store.event_exists(ext_id):
-                continue
-            rows.append(
-                {
-                    "id": str(uuid4()),
-                    "source_id": source_id,
-                    **item,
-                    "ingested_at": datetime.now(UTC).isoformat(),
-                }
-            )
+        if self._source_id is None:
+            self._source_id = memory_store.get_source_id("social_media")
+        source_id = self._source_id
+
+        # One membership check for the whole batch; items without an
+        # external_id cannot be deduplicated and are always kept
+        fresh = memory_store.unseen_event_ids([item["external_id"] for item in items if item.get("external_id")])
+        new_items = [item for item in items if not item.get("external_id") or item["external_id"] in fresh]
+
+        ingested_at = datetime.now(UTC).isoformat()
+        rows = [
+            {
+                "id": row_id,
+                "source_id": source_id,
+                **item,
+                "ingested_at": ingested_at,
+            }
+            for row_id, item in zip(uuid4_batch(len(new_items)), new_items)
+        ]
 
         return memory_store.add_ingested_events(rows)
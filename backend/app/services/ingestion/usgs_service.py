@@ -10,11 +10,12 @@ from __future__ import annotations
 import logging
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
-import httpx
+import orjson
 
 from app.core.config import ingestion_config as cfg
+from app.core.helpers import uuid4_batch
+from app.core.http import get_client
 from app.services.ingestion import memory_store
 from app.services.ingestion.mock_data_service import generate_mock_earthquakes
 
@@ -42,14 +43,13 @@ class USGSService:
     def __init__(self) -> None:
         self.feed_url = cfg.USGS_FEED_URL
         self.min_magnitude = cfg.USGS_MIN_MAGNITUDE
+        self._source_id: str | None = None
 
     async def poll(self) -> list[dict[str, Any]]:
         """Fetch USGS feed, filter by magnitude, deduplicate, and store.
         Falls back to realistic mock data if the API is unreachable."""
         try:
-            data = await self._fetch_feed()
-            features = data.get("features", [])
-            events = self._parse_features(features)
+            events = await self._fetch_events()
             # If real API returned nothing, supplement with mock data
             if not events:
                 logger.info("USGS returned 0 events – generating mock earthquakes")
@@ -66,75 +66,79 @@ class USGSService:
 
     # ── internals ───────────────────────────────────────────────────
 
-    async def _fetch_feed(self) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=20) as client:
-            resp = await client.get(self.feed_url)
-            resp.raise_for_status()
-            return resp.json()
+    async def _fetch_events(self) -> list[dict[str, Any]]:
+        """Download the feed and parse its features into events."""
+        # Shared pooled client: the TLS connection to USGS stays warm between polls
+        resp = await get_client().get(self.feed_url, timeout=20)
+        resp.raise_for_status()
+        return self._parse_features(orjson.loads(resp.content).get("features", []))
 
     def _parse_features(self, features: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        parsed: list[dict[str, Any]] = []
-        for feat in features:
-            props = feat.get("properties", {})
-            geom = feat.get("geometry", {})
-            coords = geom.get("coordinates", [None, None, None])
-
-            mag = props.get("mag", 0)
-            if mag is None or mag < self.min_magnitude:
-                continue
-
-            lon, lat = coords[0], coords[1]
-            depth_km = coords[2] if len(coords) > 2 else None
-            event_time = props.get("time")
-
-            parsed.append(
-                {
-                    "external_id": f"usgs-{feat.get('id', '')}",
-                    "event_type": "earthquake",
-                    "title": props.get("title", props.get("place", "Earthquake")),
-                    "description": (f"M{mag} earthquake at {props.get('place', 'unknown')}. Depth: {depth_km} km."),
-                    "severity": _magnitude_to_severity(mag),
-                    "latitude": lat,
-                    "longitude": lon,
-                    "location_name": props.get("place"),
-                    "raw_payload": {
-                        "usgs_id": feat.get("id"),
-                        "magnitude": mag,
-                        "mag_type": props.get("magType"),
-                        "depth_km": depth_km,
-                        "place": props.get("place"),
-                        "time": event_time,
-                        "url": props.get("url"),
-                        "tsunami": props.get("tsunami"),
-                        "felt": props.get("felt"),
-                        "alert": props.get("alert"),
-                        "status": props.get("status"),
-                        "type": props.get("type"),
-                    },
-                }
-            )
-
-        return parsed
+        parse = self._parse_feature
+        return [event for feat in features if (event := parse(feat)) is not None]
+
+    def _parse_feature(self, feat: dict[str, Any]) -> dict[str, Any] | None:
+        """One GeoJSON feature → event dict, or None if below the magnitude cut-off."""
+        props = feat.get("properties", {})
+        geom = feat.get("geometry", {})
+        coords = geom.get("coordinates", [None, None, None])
+
+        mag = props.get("mag", 0)
+        if mag is None or mag < self.min_magnitude:
+            return None
+
+        lon, lat = coords[0], coords[1]
+        depth_km = coords[2] if len(coords) > 2 else None
+        event_time = props.get("time")
+
+        return {
+            "external_id": f"usgs-{feat.get('id', '')}",
+            "event_type": "earthquake",
+            "title": props.get("title", props.get("place", "Earthquake")),
+            "description": (f"M{mag} earthquake at {props.get('place', 'unknown')}. Depth: {depth_km} km."),
+            "severity": _magnitude_to_severity(mag),
+            "latitude": lat,
+            "longitude": lon,
+            "location_name": props.get("place"),
+            "raw_payload": {
+                "usgs_id": feat.get("id"),
+                "magnitude": mag,
+                "mag_type": props.get("magType"),
+                "depth_km": depth_km,
+                "place": props.get("place"),
+                "time": event_time,
+                "url": props.get("url"),
+                "tsunami": props.get("tsunami"),
+                "felt": props.get("felt"),
+                "alert": props.get("alert"),
+                "status": props.get("status"),
+                "type": props.get("type"),
+            },
+        }
 
     async def _deduplicate_and_store(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not items:
             return []
 
-        source_id = memory_store.get_source_id("usgs_earthquakes")
-
-        rows = []
-        for item in items:
-            ext_id = item.get("external_id")
-            if ext_id and memory_store.event_exists(ext_id):
-                continue
-            rows.append(
-                {
-                    "id": str(uuid4()),
-                    "source_id": source_id,
-                    **item,
-                    "ingested_at": datetime.now(UTC).isoformat(),
-                }
-            )
+        if self._source_id is None:
+            self._source_id = memory_store.get_source_id("usgs_earthquakes")
+        source_id = self._source_id
+
+        # The 30-day feed repeats almost every quake each poll: check the whole
+        # batch at once instead of one lookup per item
+        fresh = memory_store.unseen_event_ids([item["external_id"] for item in items if item.get("external_id")])
+        new_items = [item for item in items if not item.get("external_id") or item["external_id"] in fresh]
+
+        ingested_at = datetime.now(UTC).isoformat()
+        rows = [
+            {
+                "id": row_id,
+                "source_id": source_id,
+                **item,
+                "ingested_at": ingested_at,
+            }
+            for row_id, item in zip(uuid4_batch(len(new_items)), new_items)
+        ]
 
         return memory_store.add_ingested_events(rows)
 
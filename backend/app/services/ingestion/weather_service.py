@@ -7,20 +7,26 @@ and stores observations in the weather_observations table.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 import httpx
+import orjson
 
 from app.core.config import ingestion_config as cfg
+from app.core.http import get_client
 from app.database import db_admin
 from app.services.ingestion import memory_store
 from app.services.ingestion.mock_data_service import generate_mock_weather
 
 logger = logging.getLogger("ingestion.weather")
 
+# Caps concurrent OpenWeatherMap requests per poll (the API rate-limits per key)
+_fetch_semaphore = asyncio.Semaphore(20)
+
 
 class WeatherService:
     """Polls OpenWeatherMap for current weather conditions."""
@@ -55,15 +61,20 @@ class WeatherService:
         if locations is None:
             locations = await self._get_tracked_locations()
 
-        results: list[dict[str, Any]] = []
-        async with httpx.AsyncClient(timeout=15) as client:
-            for loc in locations:
+        # Shared pooled client: connections to OpenWeatherMap are reused across polls
+        client = get_client()
+
+        async def fetch_one(loc: dict[str, Any]) -> dict[str, Any] | None:
+            async with _fetch_semaphore:
                 try:
-                    obs = await self._fetch_current(client, loc)
-                    if obs:
-                        results.append(obs)
+                    return await self._fetch_current(client, loc)
                 except Exception:
                     logger.exception("Weather fetch failed for %s", loc.get("name", loc.get("id")))
+                    return None
+
+        # One request per location, fanned out instead of awaited in turn
+        observations = await asyncio.gather(*(fetch_one(loc) for loc in locations))
+        results = [obs for obs in observations if obs]
 
         if results:
             await self._store_observations(results)
@@ -77,8 +88,7 @@ class WeatherService:
             # Return mock data for the coordinate
             mocks = generate_mock_weather([{"id": "adhoc", "latitude": lat, "longitude": lon}])
             return mocks[0] if mocks else None
-        async with httpx.AsyncClient(timeout=15) as client:
-            return await self._fetch_current(client, {"latitude": lat, "longitude": lon})
+        return await self._fetch_current(get_client(), {"latitude": lat, "longitude": lon})
 
     # ── internals ───────────────────────────────────────────────────
 
@@ -98,9 +108,9 @@ class WeatherService:
 
         url = f"{self.base_url}/weather"
         params = {"lat": lat, "lon": lon, "appid": self.api_key, "units": "metric"}
-        resp = await client.get(url, params=params)
+        resp = await client.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data: dict[str, Any] = resp.json()
+        data: dict[str, Any] = orjson.loads(resp.content)
 
         main = data.get("main", {})
         wind = data.get("wind", {})
@@ -7,11 +7,13 @@ when the trained checkpoint is available, falling back to the legacy
 RandomForest / rule-based approach otherwise.
 """
 
+import asyncio
 import json
 import logging
 import math
 import os
 import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -33,12 +35,14 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from xgboost import XGBRegressor
 
+from app.core.query_cache import TTL_SHORT, cache_get, cache_invalidate_prefix, cache_set
 from app.database import db_admin
 from app.schemas import PredictionType
 from app.services.training.data_pipeline import (
     DISASTER_TYPES,
     SEVERITY_ORDER,
     TERRAIN_TYPES,
+    save_model,
 )
 
 # Lazy-loaded TFT forecaster singleton
@@ -47,6 +51,112 @@ _tft_load_attempted = False
 
 logger = logging.getLogger(__name__)
 
+# Column layouts of the training frames (training.data_pipeline.load_*_data);
+# the feature builders fill a NumPy row in this order instead of going through
+# a dict → DataFrame conversion on every prediction.
+_DTYPE_COLUMNS = [f"dtype_{dt}" for dt in DISASTER_TYPES]
+_DTYPE_INDEX = {dt: i for i, dt in enumerate(DISASTER_TYPES)}
+_SEVERITY_COLUMNS = pd.Index(
+    [
+        "temperature",
+        "wind_speed",
+        "humidity",
+        "pressure",
+        "wind_humidity_idx",
+        "pressure_drop",
+        "temp_deviation",
+    ]
+    + _DTYPE_COLUMNS
+)
+_SPREAD_COLUMNS = pd.Index(
+    [
+        "current_area_km2",
+        "wind_speed",
+        "wind_direction",
+        "elevation_m",
+        "vegetation_density",
+        "days_active",
+        "terrain_idx",
+    ]
+    + _DTYPE_COLUMNS
+)
+_IMPACT_COLUMNS = pd.Index(
+    [
+        "severity_score",
+        "affected_population",
+        "gdp_per_capita",
+        "infrastructure_density",
+    ]
+    + _DTYPE_COLUMNS
+)
+
+
+# Raw model outputs are memoised per feature row for TTL_SHORT: the same
+# location/weather is typically re-predicted several times within a minute.
+# Rows are rounded to this many decimals to form the key.
+_INFERENCE_CACHE_PREFIX = "ml:inference:"
+_INFERENCE_KEY_DECIMALS = 2
+
+
+# Upper bound on rows sent to a model in one coalesced predict call
+_MAX_INFERENCE_BATCH = 64
+
+
+def _feature_frame(values: list[float], dtype: str, columns: pd.Index) -> pd.DataFrame:
+    """Single-row frame: *values* followed by the one-hot disaster type."""
+    row = np.zeros((1, len(columns)))
+    n = len(values)
+    row[0, :n] = values
+    idx = _DTYPE_INDEX.get(dtype)
+    if idx is not None:
+        row[0, n + idx] = 1.0
+    return pd.DataFrame(row, columns=columns, copy=False)
+
+
+class _InferenceBatcher:
+    """
+    Coalesces single-row predictions into one model call.
+
+    Rows submitted during the same event-loop iteration (e.g. the concurrent
+    predictions of an ``asyncio.gather``) are stacked and passed to *run*
+    together; each caller gets its own entry of the returned list.  The flush
+    is scheduled with ``call_soon``, so a lone request is not delayed.
+    """
+
+    def __init__(self, run: Callable[[pd.DataFrame], list[Any]]):
+        self._run = run
+        self._pending: list[tuple[pd.DataFrame, asyncio.Future]] = []
+
+    def submit(self, frame: pd.DataFrame) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        self._pending.append((frame, fut))
+        if len(self._pending) >= _MAX_INFERENCE_BATCH:
+            self._flush()
+        return fut
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if len(batch) == 1:
+            frame = batch[0][0]
+        else:
+            rows = np.vstack([f.to_numpy() for f, _ in batch])
+            frame = pd.DataFrame(rows, columns=batch[0][0].columns, copy=False)
+        try:
+            results = self._run(frame)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
+
 
 class MLService:
     """Service for loading and using trained ML models for disaster prediction."""
@@ -70,6 +180,15 @@ class MLService:
             "recent_events": [],
             "last_updated": None,
         }
+        # Unwrapped (scaler mean, scaler scale, estimator) for the trained pipelines
+        # whose shape is known; see _unwrap_scaled_pipeline
+        self._severity_fast_path: tuple[np.ndarray, np.ndarray, RandomForestClassifier] | None = None
+        self._impact_fast_path: tuple[np.ndarray, np.ndarray, list[Any]] | None = None
+        self._batchers = {
+            "severity": _InferenceBatcher(self._severity_model_output),
+            "spread": _InferenceBatcher(self._spread_model_output),
+            "impact": _InferenceBatcher(self._impact_model_output),
+        }
 
     # ── Model loading ─────────────────────────────────────────────────────
 
@@ -94,6 +213,8 @@ class MLService:
 
             # Attempt to load TFT model for severity forecasting
             self._load_tft_model()
+            cache_invalidate_prefix(_INFERENCE_CACHE_PREFIX)
+            self._warm_up_models()
 
             self.models_loaded = True
             logger.info("ML models loaded successfully")
@@ -131,7 +252,15 @@ class MLService:
             logger.error("  ✘ TFT load error: %s", e)
 
     def _load_real_models(self):
-        """Load joblib-serialized pipelines from the models/ directory."""
+        """Load joblib-serialized pipelines from the models/ directory.
+
+        The pickles are written uncompressed (``save_model``), so joblib maps
+        their plain numpy arrays read-only instead of reading them into memory.
+        In practice that covers only the StandardScaler ``mean_``/``scale_``:
+        sklearn trees copy their node arrays into their own buffers on unpickle
+        and XGBoost boosters deserialize from raw bytes, so forests and boosters
+        still live in each worker's private memory.
+        """
         sev_path = self.model_dir / "severity_model.pkl"
         spr_path = self.model_dir / "spread_model.pkl"
         spr_lo = self.model_dir / "spread_lower.pkl"
@@ -140,7 +269,8 @@ class MLService:
 
         # Severity
         if sev_path.exists():
-            self.models["severity"] = joblib.load(sev_path)
+            self.models["severity"] = joblib.load(sev_path, mmap_mode="r")
+            self._severity_fast_path = self._forest_fast_path(self.models["severity"])
             meta = self.model_dir / "severity_metadata.json"
             if meta.exists():
                 with open(meta) as f:
@@ -152,12 +282,12 @@ class MLService:
 
         # Spread (median + quantile bounds)
         if spr_path.exists():
-            self.models["spread"] = joblib.load(spr_path)
+            self.models["spread"] = joblib.load(spr_path, mmap_mode="r")
             self.models["spread_lower"] = (
-                joblib.load(spr_lo) if spr_lo.exists() else None
+                joblib.load(spr_lo, mmap_mode="r") if spr_lo.exists() else None
             )
             self.models["spread_upper"] = (
-                joblib.load(spr_hi) if spr_hi.exists() else None
+                joblib.load(spr_hi, mmap_mode="r") if spr_hi.exists() else None
             )
             meta = self.model_dir / "spread_metadata.json"
             if meta.exists():
@@ -174,7 +304,8 @@ class MLService:
 
         # Impact
         if imp_path.exists():
-            self.models["impact"] = joblib.load(imp_path)
+            self.models["impact"] = joblib.load(imp_path, mmap_mode="r")
+            self._impact_fast_path = self._xgb_fast_path(self.models["impact"])
             meta = self.model_dir / "impact_metadata.json"
             if meta.exists():
                 with open(meta) as f:
@@ -184,11 +315,90 @@ class MLService:
             logger.warning("  ✘ impact_model.pkl not found — using fallback")
             self.models["impact"] = None
 
+    @staticmethod
+    def _unwrap_scaled_pipeline(pipeline: Any) -> tuple[np.ndarray, np.ndarray, Any] | None:
+        """Split a StandardScaler → [samplers] → estimator pipeline.
+
+        Returns the scaler's mean/scale and the final estimator so a feature
+        array can be scaled with plain NumPy and handed to the estimator
+        directly, or None for any other shape.  Samplers (SMOTE) only act
+        during fit and are skipped at predict time by the pipeline as well.
+        """
+        try:
+            steps = [step for _, step in pipeline.steps]
+        except AttributeError:
+            return None
+        if len(steps) < 2 or any(not hasattr(step, "fit_resample") for step in steps[1:-1]):
+            return None
+        scaler = steps[0]
+        if not (isinstance(scaler, StandardScaler) and scaler.with_mean and scaler.with_std):
+            return None
+        return scaler.mean_, scaler.scale_, steps[-1]
+
+    @classmethod
+    def _forest_fast_path(cls, pipeline: Any) -> tuple[np.ndarray, np.ndarray, RandomForestClassifier] | None:
+        """Scaler parameters and forest of the severity pipeline, if it has the trained shape."""
+        parts = cls._unwrap_scaled_pipeline(pipeline)
+        if parts is None or not isinstance(parts[2], RandomForestClassifier):
+            return None
+        return parts
+
+    @classmethod
+    def _xgb_fast_path(cls, pipeline: Any) -> tuple[np.ndarray, np.ndarray, list[Any]] | None:
+        """Scaler parameters and one booster per target of the XGBoost impact pipeline.
+
+        None for any other shape (e.g. the GradientBoosting fallback used when
+        xgboost was missing in training).
+        """
+        parts = cls._unwrap_scaled_pipeline(pipeline)
+        if parts is None:
+            return None
+        mean, scale, reg = parts
+        try:
+            boosters = [est.get_booster() for est in reg.estimators_]
+        except (AttributeError, TypeError):
+            return None
+        return mean, scale, boosters
+
+    def _warm_up_models(self):
+        """Run one default-feature prediction through each loaded model.
+
+        The first call into sklearn/XGBoost pays for lazy imports, library
+        initialisation and page-faulting the (memory-mapped) model arrays;
+        doing it here keeps that off the first real request.
+        """
+        warm_ups = (
+            ("severity", self._build_severity_features, self._severity_model_output),
+            ("spread", self._build_spread_features, self._spread_model_output),
+            ("impact", self._build_impact_features, self._impact_model_output),
+        )
+        for kind, build, run in warm_ups:
+            if self.models.get(kind) is None:
+                continue
+            try:
+                run(build({}))
+            except Exception as e:
+                logger.warning("  ✘ %s model warm-up failed: %s", kind, e)
+
     def _load_fallback_models(self):
         """Populate with None so prediction methods use rule-based fallback."""
         self.models = {"severity": None, "spread": None, "impact": None}
+        self._severity_fast_path = None
+        self._impact_fast_path = None
         self.model_version = "fallback"
 
+    # ── Inference cache ───────────────────────────────────────────────────
+
+    async def _cached_inference(self, kind: str, features_frame: pd.DataFrame) -> Any:
+        """Model output for one feature row: a recent cached result, or a batched predict."""
+        row = tuple(features_frame.to_numpy()[0].round(_INFERENCE_KEY_DECIMALS).tolist())
+        key = f"{_INFERENCE_CACHE_PREFIX}{kind}:{self.model_version}:{row}"
+        value = cache_get(key)
+        if value is None:
+            value = await self._batchers[kind].submit(features_frame)
+            cache_set(key, value, TTL_SHORT)
+        return value
+
     # ── Feature builders ──────────────────────────────────────────────────
 
     def _build_severity_features(self, features: dict[str, Any]) -> pd.DataFrame:
@@ -199,19 +409,11 @@ class MLService:
         pres = float(features.get("pressure", 1013))
         dtype = features.get("disaster_type", "other")
 
-        row = {
-            "temperature": temp,
-            "wind_speed": wind,
-            "humidity": hum,
-            "pressure": pres,
-            "wind_humidity_idx": wind * hum / 100.0,
-            "pressure_drop": 1013.25 - pres,
-            "temp_deviation": abs(temp - 25),
-        }
-        for dt in DISASTER_TYPES:
-            row[f"dtype_{dt}"] = 1.0 if dtype == dt else 0.0
-
-        return pd.DataFrame([row])
+        return _feature_frame(
+            [temp, wind, hum, pres, wind * hum / 100.0, 1013.25 - pres, abs(temp - 25)],
+            dtype,
+            _SEVERITY_COLUMNS,
+        )
 
     def _build_spread_features(self, features: dict[str, Any]) -> pd.DataFrame:
         area = float(features.get("current_area", features.get("current_area_km2", 50)))
@@ -225,19 +427,11 @@ class MLService:
 
         terrain_idx = TERRAIN_TYPES.index(terrain) if terrain in TERRAIN_TYPES else 0
 
-        row = {
-            "current_area_km2": area,
-            "wind_speed": wind,
-            "wind_direction": wind_dir,
-            "elevation_m": elev,
-            "vegetation_density": veg,
-            "days_active": days,
-            "terrain_idx": terrain_idx,
-        }
-        for dt in DISASTER_TYPES:
-            row[f"dtype_{dt}"] = 1.0 if dtype == dt else 0.0
-
-        return pd.DataFrame([row])
+        return _feature_frame(
+            [area, wind, wind_dir, elev, veg, days, terrain_idx],
+            dtype,
+            _SPREAD_COLUMNS,
+        )
 
     def _build_impact_features(self, features: dict[str, Any]) -> pd.DataFrame:
         sev = float(features.get("severity_score", 0.5))
@@ -248,16 +442,7 @@ class MLService:
         infra = float(features.get("infrastructure_density", 0.5))
         dtype = features.get("disaster_type", "other")
 
-        row = {
-            "severity_score": sev,
-            "affected_population": pop,
-            "gdp_per_capita": gdp,
-            "infrastructure_density": infra,
-        }
-        for dt in DISASTER_TYPES:
-            row[f"dtype_{dt}"] = 1.0 if dtype == dt else 0.0
-
-        return pd.DataFrame([row])
+        return _feature_frame([sev, pop, gdp, infra], dtype, _IMPACT_COLUMNS)
 
     @staticmethod
     def _confidence_band(score: float) -> str:
@@ -538,27 +723,8 @@ class MLService:
         model = self.models.get("severity")
         if model is not None:
             X = self._build_severity_features(features)
-            pred_idx = int(model.predict(X)[0])
+            pred_idx, confidence, margin = await self._cached_inference("severity", X)
             severity = SEVERITY_ORDER[pred_idx]
-
-            # Confidence from class probabilities
-            margin = None
-            if hasattr(model, "predict_proba"):
-                proba = model.predict_proba(X)[0]
-                confidence = float(np.max(proba))
-                sorted_proba = np.sort(proba)
-                if len(sorted_proba) > 1:
-                    margin = float(sorted_proba[-1] - sorted_proba[-2])
-            else:
-                clf = model[-1] if hasattr(model, "__getitem__") else model
-                if hasattr(clf, "predict_proba"):
-                    proba = clf.predict_proba(X)[0]
-                    confidence = float(np.max(proba))
-                    sorted_proba = np.sort(proba)
-                    if len(sorted_proba) > 1:
-                        margin = float(sorted_proba[-1] - sorted_proba[-2])
-                else:
-                    confidence = 0.75
             confidence = self._calibrate_classification_confidence(confidence, margin)
         else:
             severity, confidence = self._fallback_severity(features)
@@ -587,6 +753,36 @@ class MLService:
         )
         return result
 
+    def _severity_model_output(self, features_frame: pd.DataFrame) -> list[tuple[int, float, float | None]]:
+        """Class index, top-class probability and top-two margin per row."""
+        fast_path = self._severity_fast_path
+        if fast_path is not None:
+            # Scale with NumPy and query the forest directly: one tree traversal
+            # for probabilities, with the class taken as their argmax exactly
+            # like RandomForestClassifier.predict
+            mean, scale, clf = fast_path
+            proba = clf.predict_proba((features_frame.to_numpy() - mean) / scale)
+            pred_idx = clf.classes_.take(np.argmax(proba, axis=1))
+        else:
+            model = self.models["severity"]
+            pred_idx = model.predict(features_frame)
+
+            # Confidence from class probabilities
+            proba = None
+            if hasattr(model, "predict_proba"):
+                proba = model.predict_proba(features_frame)
+            else:
+                clf = model[-1] if hasattr(model, "__getitem__") else model
+                if hasattr(clf, "predict_proba"):
+                    proba = clf.predict_proba(features_frame)
+            if proba is None:
+                return [(int(idx), 0.75, None) for idx in pred_idx]
+
+        sorted_proba = np.sort(proba, axis=1)
+        confidence = sorted_proba[:, -1].tolist()
+        margin = (sorted_proba[:, -1] - sorted_proba[:, -2]).tolist() if proba.shape[1] > 1 else [None] * len(proba)
+        return [(int(idx), c, m) for idx, c, m in zip(pred_idx, confidence, margin)]
+
     async def get_disaster_forecast(self, disaster_id: str, horizon_hours: int = 48) -> dict[str, Any]:
         """Get severity forecast for a specific disaster by fetching its current state."""
         try:
@@ -655,13 +851,7 @@ class MLService:
         model = self.models.get("spread")
         if model is not None:
             X = self._build_spread_features(features)
-            predicted_area = float(model.predict(X)[0])
-
-            lower = upper = None
-            if self.models.get("spread_lower") is not None:
-                lower = float(self.models["spread_lower"].predict(X)[0])
-            if self.models.get("spread_upper") is not None:
-                upper = float(self.models["spread_upper"].predict(X)[0])
+            predicted_area, lower, upper = await self._cached_inference("spread", X)
 
             ci_width = (
                 (upper - lower) if (lower is not None and upper is not None) else None
@@ -728,6 +918,32 @@ class MLService:
 
         return result
 
+    def _spread_model_output(self, features_frame: pd.DataFrame) -> list[tuple[float, float | None, float | None]]:
+        """Median area plus the quantile bounds (when those models are loaded) per row."""
+        predicted_area = self.models["spread"].predict(features_frame).tolist()
+
+        n = len(predicted_area)
+        lower = upper = [None] * n
+        if self.models.get("spread_lower") is not None:
+            lower = self.models["spread_lower"].predict(features_frame).tolist()
+        if self.models.get("spread_upper") is not None:
+            upper = self.models["spread_upper"].predict(features_frame).tolist()
+        return list(zip(predicted_area, lower, upper))
+
+    def _impact_model_output(self, features_frame: pd.DataFrame) -> list[tuple[float, float]]:
+        """[casualties, economic_damage] per row; tuples so cached entries stay immutable."""
+        fast_path = self._impact_fast_path
+        if fast_path is not None:
+            # Same arithmetic as StandardScaler.transform; XGBoost predicts on
+            # float32 internally, so inplace_predict on a float32 array gives
+            # identical results without building a DMatrix per target.
+            mean, scale, boosters = fast_path
+            rows = ((features_frame.to_numpy() - mean) / scale).astype(np.float32)
+            pred = np.column_stack([booster.inplace_predict(rows) for booster in boosters])
+        else:
+            pred = self.models["impact"].predict(features_frame)
+        return [tuple(row) for row in pred.tolist()]
+
     async def get_disaster_recommendations(self, disaster_id: str) -> list[str]:
         """Get resource recommendations for a specific disaster."""
         try:
@@ -763,7 +979,7 @@ class MLService:
         model = self.models.get("impact")
         if model is not None:
             X = self._build_impact_features(features)
-            pred = model.predict(X)[0]  # [casualties, economic_damage]
+            pred = await self._cached_inference("impact", X)  # (casualties, economic_damage)
             casualties = max(0, int(round(pred[0])))
             damage = max(0.0, float(pred[1]))
             magnitude = casualties + (damage / 1_000_000.0)
@@ -1800,7 +2016,7 @@ class MLService:
             # Save model and scaler
             pipeline = Pipeline([("scaler", scaler), ("clf", model)])
             model_path = self.model_dir / f"{model_type}_model.pkl"
-            joblib.dump(pipeline, model_path)
+            save_model(pipeline, model_path)
 
             # Save metadata
             metadata = {
@@ -1844,7 +2060,7 @@ class MLService:
                 # Save model and scaler
                 pipeline = Pipeline([("scaler", scaler), ("regressor", model)])
                 model_path = self.model_dir / f"{model_type}_model.pkl"
-                joblib.dump(pipeline, model_path)
+                save_model(pipeline, model_path)
 
                 # Save metadata
                 metadata = {
@@ -1884,7 +2100,7 @@ class MLService:
                 # Save model and scaler
                 pipeline = Pipeline([("scaler", scaler), ("regressor", model)])
                 model_path = self.model_dir / f"{model_type}_model.pkl"
-                joblib.dump(pipeline, model_path)
+                save_model(pipeline, model_path)
 
                 # Save metadata
                 metadata = {
@@ -6,8 +6,11 @@ generated by scripts/generate_training_data.py.
 """
 
 import logging
+import os
 from pathlib import Path
+from typing import Any
 
+import joblib
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
@@ -44,6 +47,22 @@ def _load_csv(name: str) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+def save_model(model: Any, path: Path) -> None:
+    """
+    Persist *model* uncompressed and swap it into place atomically.
+
+    MLService loads the pickles with ``mmap_mode="r"``, which maps any plain
+    numpy arrays (the scaler statistics) straight from the file, so the live
+    file must never be truncated underneath it: the dump goes to a sibling
+    temp file which then replaces *path* (running processes keep the old,
+    unlinked copy).  The swap also means a reader never sees a half-written
+    model.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    joblib.dump(model, tmp_path, compress=0)
+    os.replace(tmp_path, path)
+
+
 def add_rolling_weather_features(df: pd.DataFrame) -> pd.DataFrame:
     """Add engineered weather features — rolling averages and interaction terms."""
     df = df.copy()
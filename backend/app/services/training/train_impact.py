@@ -10,7 +10,6 @@ import logging
 import time
 from pathlib import Path
 
-import joblib
 import numpy as np
 import pandas as pd
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
@@ -26,7 +25,7 @@ except ImportError:
     HAS_XGB = False
     from sklearn.ensemble import GradientBoostingRegressor
 
-from app.services.training.data_pipeline import DISASTER_TYPES, load_impact_data
+from app.services.training.data_pipeline import DISASTER_TYPES, load_impact_data, save_model
 
 logger = logging.getLogger(__name__)
 
@@ -150,7 +149,7 @@ def train_impact_model(
         logger.info(f"  {tgt} — MAE: {mae:.2f}, RMSE: {rmse:.2f}, R²: {r2:.4f}")
 
     # Persist
-    joblib.dump(pipeline, model_dir / "impact_model.pkl")
+    save_model(pipeline, model_dir / "impact_model.pkl")
     logger.info(f"Impact model saved → {model_dir}")
 
     feature_names = list(X_train.columns)
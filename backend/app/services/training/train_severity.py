@@ -9,7 +9,6 @@ import logging
 import time
 from pathlib import Path
 
-import joblib
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, f1_score
 from sklearn.pipeline import Pipeline
@@ -23,7 +22,7 @@ try:
 except ImportError:
     HAS_IMBLEARN = False
 
-from app.services.training.data_pipeline import SEVERITY_ORDER, load_severity_data
+from app.services.training.data_pipeline import SEVERITY_ORDER, load_severity_data, save_model
 
 logger = logging.getLogger(__name__)
 
@@ -108,7 +107,7 @@ def train_severity_model(
 
     # Persist model
     model_path = model_dir / "severity_model.pkl"
-    joblib.dump(pipeline, model_path)
+    save_model(pipeline, model_path)
     logger.info(f"Model saved → {model_path}")
 
     # Persist metadata
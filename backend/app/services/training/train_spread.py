@@ -9,14 +9,13 @@ import logging
 import time
 from pathlib import Path
 
-import joblib
 import numpy as np
 from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from app.services.training.data_pipeline import load_spread_data
+from app.services.training.data_pipeline import load_spread_data, save_model
 
 logger = logging.getLogger(__name__)
 
@@ -108,9 +107,9 @@ def train_spread_model(
     upper_pipeline.fit(X_train, y_train)
 
     # Persist
-    joblib.dump(pipeline, model_dir / "spread_model.pkl")
-    joblib.dump(lower_pipeline, model_dir / "spread_lower.pkl")
-    joblib.dump(upper_pipeline, model_dir / "spread_upper.pkl")
+    save_model(pipeline, model_dir / "spread_model.pkl")
+    save_model(lower_pipeline, model_dir / "spread_lower.pkl")
+    save_model(upper_pipeline, model_dir / "spread_upper.pkl")
     logger.info(f"Spread models saved → {model_dir}")
 
     feature_names = list(X_train.columns)
@@ -239,6 +239,10 @@ async def lifespan(app: FastAPI):
         await app.state.ingestion_orchestrator.stop()
         logger.info("Ingestion orchestrator stopped")
 
+    from app.core.http import close_client
+
+    await close_client()
+
 
 async def _sitrep_cron_loop():
     """Daily cron loop that generates situation reports at the configured hour."""
@@ -0,0 +1,48 @@
+"""
+Tests for the alert notification service.
+"""
+
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.config import ingestion_config
+from app.services.ingestion.alert_service import AlertNotificationService
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_stored_in_one_bulk_write():
+    """Every recipient's notification is persisted with a single store call."""
+    service = AlertNotificationService()
+    recipients = [
+        {"id": "u1", "email": "a@example.org", "role": "ngo"},
+        {"id": "u2", "email": "b@example.org", "role": "admin"},
+        {"id": "u3", "email": None, "role": "ngo"},
+    ]
+    service._get_ngo_recipients = AsyncMock(return_value=recipients)
+    event = {"id": "evt-1", "title": "M7.1 earthquake", "severity": "critical", "event_type": "earthquake"}
+    log_only = replace(ingestion_config, SENDGRID_API_KEY="", ALERT_SEVERITY_THRESHOLD="critical")
+
+    with (
+        patch("app.services.ingestion.alert_service.cfg", log_only),
+        patch("app.services.ingestion.alert_service.memory_store.add_alert_notifications") as store,
+    ):
+        notifications = await service.evaluate_and_notify(event)
+
+    store.assert_called_once_with(notifications)
+    assert [n["recipient"] for n in notifications] == ["a@example.org", "b@example.org", None]
+    assert all(n["channel"] == "log" and n["event_id"] == "evt-1" for n in notifications)
+
+
+@pytest.mark.asyncio
+async def test_below_threshold_stores_nothing():
+    service = AlertNotificationService()
+    service._get_ngo_recipients = AsyncMock()
+
+    with patch("app.services.ingestion.alert_service.memory_store.add_alert_notifications") as store:
+        notifications = await service.evaluate_and_notify({"severity": "low"})
+
+    assert notifications == []
+    store.assert_not_called()
+    service._get_ngo_recipients.assert_not_called()
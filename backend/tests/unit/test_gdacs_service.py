@@ -0,0 +1,30 @@
+"""
+Tests for the GDACS feed poller.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from app.services.ingestion import memory_store
+from app.services.ingestion.gdacs_service import GDACSService
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_and_store_returns_only_new_events(monkeypatch):
+    """Rows go straight to the store, which ignores external_ids it has already seen."""
+    # Fresh store state; the module keeps it globally
+    monkeypatch.setattr(memory_store, "_seen_event_ids", OrderedDict())
+    monkeypatch.setattr(memory_store, "_ingested_events", OrderedDict())
+    service = GDACSService()
+    items = [
+        {"external_id": "gdacs-EQ-1", "title": "Earthquake"},
+        {"external_id": "gdacs-FL-2", "title": "Flood"},
+    ]
+
+    first = await service._deduplicate_and_store(items)
+    second = await service._deduplicate_and_store([*items, {"external_id": "gdacs-TC-3", "title": "Cyclone"}])
+
+    assert [e["external_id"] for e in first] == ["gdacs-EQ-1", "gdacs-FL-2"]
+    assert [e["external_id"] for e in second] == ["gdacs-TC-3"]
+    assert all(e["source_id"] == memory_store.get_source_id("gdacs") for e in first + second)
@@ -0,0 +1,130 @@
+"""
+Tests for the in-memory ingestion store.
+"""
+
+import random
+
+import pytest
+
+from app.services.ingestion import memory_store
+
+
+@pytest.fixture(autouse=True)
+def _empty_store():
+    """Each test starts from an empty store; the module keeps global state."""
+    collections = (
+        memory_store._ingested_events,
+        memory_store._satellite_observations,
+        memory_store._alert_notifications,
+        memory_store._seen_event_ids,
+        memory_store._seen_satellite_ids,
+        memory_store._satellite_cells,
+    )
+    for collection in collections:
+        collection.clear()
+    yield
+    for collection in collections:
+        collection.clear()
+
+
+class TestAlertNotifications:
+    """Bulk notification writes."""
+
+    def test_batch_is_stored_and_queried_newest_first(self):
+        memory_store.add_alert_notifications(
+            [{"id": f"n{i}", "severity": "critical", "status": "logged"} for i in range(3)]
+        )
+
+        assert [n["id"] for n in memory_store.query_alerts()] == ["n2", "n1", "n0"]
+
+    def test_batch_is_trimmed_to_the_store_limit(self, monkeypatch):
+        monkeypatch.setattr(memory_store, "_MAX_ALERTS", 3)
+
+        memory_store.add_alert_notifications([{"id": f"n{i}"} for i in range(5)])
+
+        assert [n["id"] for n in memory_store.query_alerts()] == ["n4", "n3", "n2"]
+
+
+class TestIngestedEvents:
+    """add_ingested_events is an insert-or-ignore on external_id."""
+
+    def test_duplicates_within_and_across_batches_are_ignored(self):
+        first = memory_store.add_ingested_events(
+            [
+                {"id": "1", "external_id": "gdacs-EQ-1"},
+                {"id": "2", "external_id": "gdacs-EQ-1"},
+                {"id": "3", "external_id": "gdacs-FL-2"},
+            ]
+        )
+        second = memory_store.add_ingested_events(
+            [{"id": "4", "external_id": "gdacs-FL-2"}, {"id": "5", "external_id": "gdacs-TC-3"}]
+        )
+
+        assert [e["id"] for e in first] == ["1", "3"]
+        assert [e["id"] for e in second] == ["5"]
+        assert memory_store.unseen_event_ids(["gdacs-EQ-1", "gdacs-TC-3", "gdacs-VO-4"]) == {"gdacs-VO-4"}
+
+    def test_events_without_external_id_are_always_stored(self):
+        added = memory_store.add_ingested_events([{"id": "1"}, {"id": "2", "external_id": ""}])
+
+        assert [e["id"] for e in added] == ["1", "2"]
+
+
+class TestSeenIdLru:
+    """Seen-id sets are bounded LRUs: re-reported ids stay, stale ones age out."""
+
+    def test_oldest_unreported_id_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(memory_store, "_MAX_SEEN_IDS", 3)
+        memory_store.add_ingested_events([{"id": str(i), "external_id": f"e{i}"} for i in range(3)])
+
+        # e0 is re-reported (and ignored), which refreshes it; e1 is now the oldest
+        assert memory_store.add_ingested_events([{"id": "x", "external_id": "e0"}]) == []
+        memory_store.add_ingested_events([{"id": "3", "external_id": "e3"}])
+
+        assert memory_store.unseen_event_ids(["e0", "e1", "e2", "e3"]) == {"e1"}
+
+    def test_evicted_id_is_accepted_again(self, monkeypatch):
+        monkeypatch.setattr(memory_store, "_MAX_SEEN_IDS", 2)
+        memory_store.add_satellite_observations(
+            [{"id": str(i), "external_id": f"s{i}", "latitude": 0, "longitude": 0} for i in range(3)]
+        )
+
+        added = memory_store.add_satellite_observations(
+            [{"id": "9", "external_id": "s0", "latitude": 0, "longitude": 0}]
+        )
+
+        assert [o["id"] for o in added] == ["9"]
+
+
+def _in_box(obs, lat_range, lon_range):
+    return lat_range[0] <= obs["latitude"] <= lat_range[1] and lon_range[0] <= obs["longitude"] <= lon_range[1]
+
+
+class TestSatelliteGrid:
+    """Area queries over the lat/lon grid match a full newest-first scan."""
+
+    def test_box_query_matches_linear_scan(self):
+        rng = random.Random(7)
+        observations = [
+            {"id": str(i), "external_id": f"s{i}", "latitude": rng.uniform(-5, 5), "longitude": rng.uniform(-5, 5)}
+            for i in range(300)
+        ]
+        memory_store.add_satellite_observations(observations)
+
+        for lat_range, lon_range in (((-1.5, 2.25), (-3.0, 0.5)), ((0.0, 1.0), (0.0, 1.0)), ((-90, 90), (-180, 180))):
+            expected = [o["id"] for o in reversed(observations) if _in_box(o, lat_range, lon_range)][:40]
+            found = memory_store.query_satellites(lat_range=lat_range, lon_range=lon_range, limit=40)
+            assert [o["id"] for o in found] == expected
+
+    def test_evicted_observations_leave_the_grid(self, monkeypatch):
+        monkeypatch.setattr(memory_store, "_MAX_SATELLITE", 2)
+        memory_store.add_satellite_observations(
+            [{"id": str(i), "external_id": f"s{i}", "latitude": 0.5, "longitude": 0.5, "frp": i} for i in range(3)]
+        )
+
+        found = memory_store.query_satellites(lat_range=(0, 1), lon_range=(0, 1))
+        summary = memory_store.summarize_satellites((0, 1), (0, 1))
+
+        assert [o["id"] for o in found] == ["2", "1"]
+        assert summary["hotspot_count"] == 2
+        assert summary["latest"]["id"] == "2"
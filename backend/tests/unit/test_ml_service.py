@@ -0,0 +1,105 @@
+"""
+Tests for MLService inference batching.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.query_cache import cache_invalidate_prefix
+from app.services.ml_service import (
+    _INFERENCE_CACHE_PREFIX,
+    _MAX_INFERENCE_BATCH,
+    MLService,
+    _InferenceBatcher,
+)
+from app.services.training.data_pipeline import SEVERITY_ORDER
+
+
+class _CountingSeverityModel:
+    """Classifier stub: the class index is the row's temperature mod 4."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls: list[pd.DataFrame] = []
+
+    def predict(self, frame: pd.DataFrame) -> np.ndarray:
+        self.calls.append(frame)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return frame["temperature"].to_numpy().astype(int) % len(SEVERITY_ORDER)
+
+    def predict_proba(self, frame: pd.DataFrame) -> np.ndarray:
+        classes = frame["temperature"].to_numpy().astype(int) % len(SEVERITY_ORDER)
+        return np.eye(len(SEVERITY_ORDER))[classes]
+
+
+def _service(model: _CountingSeverityModel) -> MLService:
+    service = MLService()
+    service.models = {"severity": model, "spread": None, "impact": None}
+    service.models_loaded = True
+    return service
+
+
+def _features(temperature: int) -> dict:
+    # Mild conditions so the severity guardrail never raises the prediction
+    return {"temperature": temperature, "wind_speed": 10, "humidity": 60, "pressure": 1013, "disaster_type": "other"}
+
+
+@pytest.fixture(autouse=True)
+def _clear_inference_cache():
+    cache_invalidate_prefix(_INFERENCE_CACHE_PREFIX)
+    yield
+    cache_invalidate_prefix(_INFERENCE_CACHE_PREFIX)
+
+
+class TestInferenceBatching:
+    """Concurrent single-row predictions share one model call."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_predictions_share_one_model_call(self):
+        model = _CountingSeverityModel()
+        service = _service(model)
+        temperatures = [20, 21, 22, 23, 24]
+
+        results = await asyncio.gather(*(service.predict_severity(_features(t)) for t in temperatures))
+
+        assert len(model.calls) == 1
+        assert model.calls[0]["temperature"].tolist() == temperatures
+        assert [r["predicted_severity"] for r in results] == [
+            SEVERITY_ORDER[t % len(SEVERITY_ORDER)] for t in temperatures
+        ]
+
+    @pytest.mark.asyncio
+    async def test_model_error_reaches_every_caller(self):
+        model = _CountingSeverityModel(fail=True)
+        service = _service(model)
+
+        results = await asyncio.gather(
+            *(service.predict_severity(_features(t)) for t in (20, 21, 22)),
+            return_exceptions=True,
+        )
+
+        assert len(model.calls) == 1
+        assert all(isinstance(r, RuntimeError) and str(r) == "model exploded" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting_for_the_loop(self):
+        batch_sizes: list[int] = []
+
+        def run(frame: pd.DataFrame) -> list[float]:
+            batch_sizes.append(len(frame))
+            return frame["x"].tolist()
+
+        batcher = _InferenceBatcher(run)
+        futures = [batcher.submit(pd.DataFrame({"x": [float(i)]})) for i in range(_MAX_INFERENCE_BATCH + 1)]
+
+        # The batch limit triggers a synchronous flush; the extra row waits for call_soon
+        assert batch_sizes == [_MAX_INFERENCE_BATCH]
+        assert all(f.done() for f in futures[:_MAX_INFERENCE_BATCH])
+        assert not futures[-1].done()
+
+        assert await asyncio.gather(*futures) == [float(i) for i in range(_MAX_INFERENCE_BATCH + 1)]
+        assert batch_sizes == [_MAX_INFERENCE_BATCH, 1]
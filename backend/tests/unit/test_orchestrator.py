@@ -0,0 +1,72 @@
+import logging
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.config import ingestion_config
+from app.services.ingestion.orchestrator import IngestionOrchestrator
+
+
+async def _run_loop(orchestrator, new_items_per_poll, interval_s):
+    """Drive _loop through one poll per entry and return the delays it slept for."""
+    results = iter(new_items_per_poll)
+    sleeps = []
+
+    async def poll_fn():
+        count = next(results)
+        if len(sleeps) == len(new_items_per_poll):
+            orchestrator._running = False
+        return count
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    orchestrator._running = True
+    orchestrator._update_source_status = AsyncMock()
+    with patch("app.services.ingestion.orchestrator.asyncio.sleep", fake_sleep):
+        await orchestrator._loop("usgs", poll_fn, interval_s)
+    # The first sleep is the fixed startup delay
+    return sleeps[1:]
+
+
+def _poll_limits(min_s, max_s):
+    """Swap in a config with the given MIN/MAX_POLL_INTERVAL_S (the config is frozen)."""
+    limits = replace(ingestion_config, MIN_POLL_INTERVAL_S=min_s, MAX_POLL_INTERVAL_S=max_s)
+    return patch("app.services.ingestion.orchestrator.cfg", limits)
+
+
+@pytest.fixture
+def orchestrator():
+    return IngestionOrchestrator()
+
+
+@pytest.mark.asyncio
+async def test_loop_backs_off_idle_feed_up_to_four_intervals(orchestrator):
+    """Empty polls double the wait after the idle threshold, capped at 4x the interval."""
+    with _poll_limits(30, 600):
+        sleeps = await _run_loop(orchestrator, [0, 0, 0, 0, 0, 0, 5, 0], 100)
+
+    assert sleeps == [100, 100, 200, 400, 400, 400, 100, 100]
+
+
+@pytest.mark.asyncio
+async def test_loop_backoff_respects_max_poll_interval(orchestrator):
+    """MAX_POLL_INTERVAL_S caps the backoff below 4x the interval."""
+    with _poll_limits(30, 250):
+        sleeps = await _run_loop(orchestrator, [0, 0, 0, 0, 0], 100)
+
+    assert sleeps == [100, 100, 200, 250, 250]
+
+
+@pytest.mark.asyncio
+async def test_loop_clamps_short_interval_and_logs_it(orchestrator, caplog):
+    """An interval below MIN_POLL_INTERVAL_S is raised to it, with a warning."""
+    with (
+        _poll_limits(30, 600),
+        caplog.at_level(logging.WARNING, logger="ingestion.orchestrator"),
+    ):
+        sleeps = await _run_loop(orchestrator, [1, 1], 10)
+
+    assert sleeps == [30, 30]
+    assert "below MIN_POLL_INTERVAL_S" in caplog.text